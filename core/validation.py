@@ -119,6 +119,34 @@ def validate_result_release_date(release_date: str, exam_date: str = None):
     return errors
 
 
+def required_grading_field_errors(
+    grading_deadline_date: str,
+    grading_deadline_time: str,
+    release_date: str,
+    release_time: str,
+) -> List[str]:
+    """
+    Required-field messages for the grading settings form, shared by
+    validate_grading_periods and the form handler's cleared-form fast path
+    so the two never drift apart.
+    """
+    errors = []
+
+    if not grading_deadline_date:
+        errors.append("Grading deadline date is required")
+
+    if not grading_deadline_time:
+        errors.append("Grading deadline time is required")
+
+    if not release_date:
+        errors.append("Result release date is required")
+
+    if not release_time:
+        errors.append("Result release time is required")
+
+    return errors
+
+
 def validate_grading_periods(
     exam_date: str,
     exam_end_time: str,
@@ -154,17 +182,11 @@ def validate_grading_periods(
         errors.append("Exam end time is required")
         return errors
 
-    if not grading_deadline_date:
-        errors.append("Grading deadline date is required")
-
-    if not grading_deadline_time:
-        errors.append("Grading deadline time is required")
-
-    if not release_date:
-        errors.append("Result release date is required")
-
-    if not release_time:
-        errors.append("Result release time is required")
+    errors.extend(
+        required_grading_field_errors(
+            grading_deadline_date, grading_deadline_time, release_date, release_time
+        )
+    )
 
     if errors:
         return errors
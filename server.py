@@ -1,4 +1,4 @@
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from firebase_admin import firestore
 import os
 
@@ -12,15 +12,17 @@ import json
 from web.auth_routes import get_login_page, post_login
 
 from web.admin_routes import (
-    get_admin_exam_list,
+    get_admin_exam_list_stream,
     get_set_result_release,
     post_set_result_release,
     get_grading_settings,
     post_grading_settings,
     get_account_import_page,
     post_import_accounts,
-    get_admin_student_list,
-    get_admin_lecturer_list,
+    get_admin_student_list_stream,
+    get_admin_lecturer_list_stream,
+    bump_user_list_version,
+    deactivate_bulk_handler,
 )
 
 from web.template_engine import STATIC_DIR
@@ -43,18 +45,34 @@ from services.student_filter_service import (
 # NEW: Import the profile routes module
 from web import profile_routes
 
+from web import grading
+from web.admin_performance_routes import get_performance_report
+from services.exam_timing import get_server_time
+from services.student_filter_service import get_exam_filters
+from services.auth_service import create_admin_account
+
 HOST = "localhost"
 PORT = 8000
 
 
 class Handler(BaseHTTPRequestHandler):
-    def _send_html(self, html_str: str, status: int = 200):
-        data = html_str.encode("utf-8")
+    def _send_html(self, html_str, status: int = 200, etag: str = None):
+        # Accepts either a full page string or a list of page fragments
+        # (from template_engine.render_parts); fragments are written one at
+        # a time instead of being joined into one big string first.
+        if isinstance(html_str, str):
+            parts = [html_str.encode("utf-8")]
+        else:
+            parts = [fragment.encode("utf-8") for fragment in html_str]
+
         self.send_response(status)
         self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Content-Length", str(sum(len(p) for p in parts)))
+        if etag:
+            self.send_header("ETag", etag)
         self.end_headers()
-        self.wfile.write(data)
+        for part in parts:
+            self.wfile.write(part)
 
     def _send_json(self, obj, status: int = 200):
         if isinstance(obj, dict):
@@ -200,20 +218,37 @@ class Handler(BaseHTTPRequestHandler):
             sort = query.get("sort", ["date"])[0]
             lecturer_id = query.get("lecturer_id", [""])[0]
 
-            html_str, status = exams.get_exam_list(
+            # A matching If-None-Match revalidates to an empty 304 and
+            # skips the fetch and render entirely
+            html_str, status, etag = exams.get_exam_list_conditional(
+                self.headers.get("If-None-Match"),
                 success_message="",
                 search=search,
                 sort=sort,
                 lecturer_id=lecturer_id,
             )
-            self._send_html(html_str, status)
+            if status == 304:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+            else:
+                self._send_html(html_str, status, etag=etag)
 
         # ------------------------------
         # ADMIN ROUTES
         # ------------------------------
         elif path == "/admin/exam-list":
-            html_str, status = get_admin_exam_list()
-            self._send_html(html_str, status)
+            # Streamed as fragments: shell, then one chunk per exam card.
+            # A matching If-None-Match short-circuits to an empty 304.
+            html_parts, status, etag = get_admin_exam_list_stream(
+                self.headers.get("If-None-Match")
+            )
+            if status == 304:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+            else:
+                self._send_html(html_parts, status, etag=etag)
 
         elif path == "/admin/grading-settings":
             exam_id = query.get("exam_id", [""])[0]
@@ -231,44 +266,64 @@ class Handler(BaseHTTPRequestHandler):
 
         elif path == "/admin/performance-report":
             exam_id = query.get("exam_id", [""])[0]
-            from web.admin_performance_routes import get_performance_report
 
             html_str, status = get_performance_report(exam_id)
             self._send_html(html_str, status)
 
         elif path == "/view-submission-result":
             submission_id = query.get("submission_id", [""])[0]
-            from web import grading
 
             html_str, status = grading.get_view_submission_result(submission_id)
             self._send_html(html_str, status)
 
         elif path == "/admin/student-list":
-            html_str, status = get_admin_student_list()
-            self._send_html(html_str, status)
+            html_parts, status, etag = get_admin_student_list_stream(
+                self.headers.get("If-None-Match")
+            )
+            if status == 304:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+            else:
+                self._send_html(html_parts, status, etag=etag)
 
         elif path == "/admin/lecturer-list":
-            html_str, status = get_admin_lecturer_list()
-            self._send_html(html_str, status)
+            html_parts, status, etag = get_admin_lecturer_list_stream(
+                self.headers.get("If-None-Match")
+            )
+            if status == 304:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+            else:
+                self._send_html(html_parts, status, etag=etag)
 
         elif path.startswith("/admin/deactivate-lecturer"):
             lecturer_id = query_components.get("id", [None])[0]
             result = deactivate_lecturer_by_id(lecturer_id, db_client)
+            if result.get("success"):
+                bump_user_list_version("lecturer")
             self._send_json(result)
 
         elif path.startswith("/admin/reactivate-lecturer"):
             lecturer_id = query_components.get("id", [None])[0]
             result = reactivate_lecturer_by_id(lecturer_id, db_client)
+            if result.get("success"):
+                bump_user_list_version("lecturer")
             self._send_json(result)
 
         elif path.startswith("/admin/deactivate-student"):
             student_id = query_components.get("id", [None])[0]
             result = deactivate_student_by_id(student_id, db_client)
+            if result.get("success"):
+                bump_user_list_version("student")
             self._send_json(result)
 
         elif path.startswith("/admin/reactivate-student"):
             student_id = query_components.get("id", [None])[0]
             result = reactivate_student_by_id(student_id, db_client)
+            if result.get("success"):
+                bump_user_list_version("student")
             self._send_json(result)
 
         # ------------------------------
@@ -295,7 +350,6 @@ class Handler(BaseHTTPRequestHandler):
             self._send_html(html_str, status)
 
         elif path == "/debug-time":
-            from services.exam_timing import get_server_time
 
             server_time = get_server_time()
             html_str = (
@@ -368,7 +422,6 @@ class Handler(BaseHTTPRequestHandler):
 
             # If exam_id is provided, also return current filters
             if exam_id:
-                from services.student_filter_service import get_exam_filters
 
                 current_filters = get_exam_filters(exam_id)
                 response_data["current_filters"] = current_filters
@@ -378,14 +431,12 @@ class Handler(BaseHTTPRequestHandler):
 
         elif path == "/grade-submissions":
             exam_id = query.get("exam_id", [""])[0]
-            from web import grading
 
             html_str, status = grading.get_grade_submissions(exam_id)
             self._send_html(html_str, status)
 
         elif path == "/grade-short-answers":
             submission_id = query.get("submission_id", [""])[0]
-            from web import grading
 
             html_str, status = grading.get_grade_short_answers(submission_id)
             self._send_html(html_str, status)
@@ -514,7 +565,6 @@ class Handler(BaseHTTPRequestHandler):
             self._send_json(json_str, status)
 
         elif path == "/save-short-answer-grades":
-            from web import grading
 
             html_str, status = grading.post_save_short_answer_grades(body)
             self._send_html(html_str, status)
@@ -530,6 +580,14 @@ class Handler(BaseHTTPRequestHandler):
             html_str, status = post_set_result_release(body)
             self._send_html(html_str, status)
 
+        elif path == "/admin/deactivate-bulk":
+            try:
+                payload = json.loads(body) if body else {}
+            except ValueError:
+                payload = {}
+            json_str, status = deactivate_bulk_handler(payload)
+            self._send_json(json_str, status)
+
         else:
             self.send_error(404, "Not Found")
 
@@ -566,11 +624,13 @@ class Handler(BaseHTTPRequestHandler):
 if __name__ == "__main__":
     try:
         # Initialize admin account on startup
-        from services.auth_service import create_admin_account
 
         create_admin_account()
 
-        httpd = HTTPServer((HOST, PORT), Handler)
+        # ThreadingHTTPServer handles each request on its own thread, so
+        # concurrent page loads overlap their Firestore round trips instead
+        # of queueing behind a single blocking handler
+        httpd = ThreadingHTTPServer((HOST, PORT), Handler)
         print(f"Serving at http://{HOST}:{PORT}")
         print("\n=== LOGIN CREDENTIALS ===")
         print("Admin: Use Admin ID 'A001' + IC number '010101070101'")
@@ -1,10 +1,61 @@
 from datetime import datetime
 from typing import Optional, Dict, List
 import secrets
+import threading
+import time
 from firebase_admin import firestore
 
 from core.firebase_db import db
 
+# Short TTL cache over exam reads: review/list pages re-fetch the same
+# documents on every refresh, so repeated hits within the window become
+# dict lookups. Every write path in this module invalidates the affected
+# entry (and the all-exams key) so edits are never served stale.
+_EXAM_READ_CACHE: dict = {}
+_EXAM_READ_CACHE_TTL = 30  # seconds
+_EXAM_READ_CACHE_MAX = 1024
+_EXAM_READ_LOCK = threading.Lock()
+_ALL_EXAMS_KEY = "*"
+
+# Monotonic per-process counter backing the exam-list ETag; every write
+# path bumps it via invalidate_exam_cache, and get_all_exams bumps it
+# when a refetch comes back different from the previous snapshot
+_EXAM_DATA_VERSION = 0
+
+
+def exam_data_version() -> int:
+    with _EXAM_READ_LOCK:
+        return _EXAM_DATA_VERSION
+
+
+def _exam_cache_get(key: str):
+    with _EXAM_READ_LOCK:
+        entry = _EXAM_READ_CACHE.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _EXAM_READ_CACHE_TTL:
+            return entry[1]
+    return None
+
+
+def _exam_cache_put(key: str, value) -> None:
+    with _EXAM_READ_LOCK:
+        if len(_EXAM_READ_CACHE) >= _EXAM_READ_CACHE_MAX:
+            # Cheap bound: drop the oldest entry by timestamp
+            oldest = min(_EXAM_READ_CACHE, key=lambda k: _EXAM_READ_CACHE[k][0])
+            del _EXAM_READ_CACHE[oldest]
+        _EXAM_READ_CACHE[key] = (time.monotonic(), value)
+
+
+def invalidate_exam_cache(exam_id: Optional[str] = None) -> None:
+    """Drop cached reads after an exam write (None clears everything)"""
+    global _EXAM_DATA_VERSION
+    with _EXAM_READ_LOCK:
+        if exam_id is None:
+            _EXAM_READ_CACHE.clear()
+        else:
+            _EXAM_READ_CACHE.pop(exam_id, None)
+            _EXAM_READ_CACHE.pop(_ALL_EXAMS_KEY, None)
+        _EXAM_DATA_VERSION += 1
+
 
 def _generate_exam_id() -> str:
     """
@@ -66,6 +117,7 @@ def save_exam_draft(
         exam_data["status"] = "draft"  # <--- Status is only set here for new exams
 
     doc_ref.set(exam_data, merge=True)
+    invalidate_exam_cache(exam_id)
     return exam_id
 
 
@@ -84,19 +136,25 @@ def publish_exam(exam_id: str):
             "published_at": datetime.utcnow(),
         }
     )
+    invalidate_exam_cache(exam_id)
 
 
 def get_exam_by_id(exam_id: str) -> Optional[Dict]:
     if not exam_id:
         return None
 
+    cached = _exam_cache_get(exam_id)
+    if cached is not None:
+        return dict(cached)
+
     # Case 1: exam_id is the document ID
     doc_ref = db.collection("exams").document(exam_id)
     snap = doc_ref.get()
     if snap.exists:
         data = snap.to_dict()
         data.setdefault("exam_id", exam_id)
-        return data
+        _exam_cache_put(exam_id, data)
+        return dict(data)
 
     # Case 2: exam_id is stored as a field (for backward compatibility)
     query = db.collection("exams").where("exam_id", "==", exam_id).limit(1).stream()
@@ -104,7 +162,8 @@ def get_exam_by_id(exam_id: str) -> Optional[Dict]:
     for doc in query:
         data = doc.to_dict()
         data.setdefault("exam_id", exam_id)
-        return data
+        _exam_cache_put(exam_id, data)
+        return dict(data)
 
     return None
 
@@ -123,6 +182,7 @@ def soft_delete_exam(exam_id: str) -> None:
 
     # mark as deleted but DO NOT remove document or questions
     ref.update({"is_deleted": True})
+    invalidate_exam_cache(exam_id)
 
 
 def delete_exam_and_contents(exam_id: str) -> None:
@@ -150,6 +210,7 @@ def delete_exam_and_contents(exam_id: str) -> None:
 
     # ---- Finally delete the exam document ----
     exam_ref.delete()
+    invalidate_exam_cache(exam_id)
 
 
 def get_all_published_exams() -> list:
@@ -174,24 +235,40 @@ def get_all_published_exams() -> list:
         return []
 
 
-def get_all_exams() -> list:
+def get_all_exams(include_deleted: bool = False) -> list:
     """
-    Fetches all exams (both draft and published)
+    Fetches all exams (both draft and published).
+
+    Soft-deleted exams are excluded by default so callers don't each
+    repeat the is_deleted check. The filter runs here rather than as a
+    Firestore where() clause because legacy exam docs predate the
+    is_deleted field and an equality filter would drop them too.
     """
+    global _EXAM_DATA_VERSION
+    cached = _exam_cache_get(_ALL_EXAMS_KEY)
+    if cached is None:
+        query = (
+            db.collection("exams")
+            .order_by("created_at", direction=firestore.Query.DESCENDING)
+            .stream()
+        )
 
-    query = (
-        db.collection("exams")
-        .order_by("created_at", direction=firestore.Query.DESCENDING)
-        .stream()
-    )
+        cached = []
+        for doc in query:
+            data = doc.to_dict()
+            data["exam_id"] = doc.id
+            cached.append(data)
 
-    exams = []
-    for doc in query:
-        data = doc.to_dict()
-        data["exam_id"] = doc.id
-        exams.append(data)
+        with _EXAM_READ_LOCK:
+            prev = _EXAM_READ_CACHE.get(_ALL_EXAMS_KEY)
+            if prev is None or prev[1] != cached:
+                _EXAM_DATA_VERSION += 1
 
-    return exams
+        _exam_cache_put(_ALL_EXAMS_KEY, cached)
+
+    if include_deleted:
+        return [dict(exam) for exam in cached]
+    return [dict(exam) for exam in cached if not exam.get("is_deleted")]
 
 
 # Admin side get exam list and set result release date
@@ -209,8 +286,6 @@ def set_result_release_date(
     if not snap.exists:
         raise ValueError(f"Exam '{exam_id}' does not exist.")
 
-    from datetime import datetime
-
     # Validate date format
     try:
         datetime.strptime(release_date, "%Y-%m-%d")
@@ -223,13 +298,23 @@ def set_result_release_date(
     except ValueError:
         raise ValueError("Invalid time format. Use HH:MM.")
 
+    # Persist an epoch timestamp alongside the string fields so list views
+    # can compare integers instead of re-running strptime per render
+    release_ts = int(
+        datetime.strptime(
+            f"{release_date} {release_time}", "%Y-%m-%d %H:%M"
+        ).timestamp()
+    )
+
     doc_ref.update(
         {
             "result_release_date": release_date,
             "result_release_time": release_time,
+            "result_release_ts": release_ts,
             "result_release_updated_at": datetime.utcnow(),
         }
     )
+    invalidate_exam_cache(exam_id)
 
 
 def save_grading_settings(
@@ -262,16 +347,37 @@ def save_grading_settings(
     if not doc.exists:
         raise ValueError(f"Exam {exam_id} not found")
 
+    update_data = {
+        "grading_deadline_date": grading_deadline_date,
+        "grading_deadline_time": grading_deadline_time,
+        "result_release_date": release_date,
+        "result_release_time": release_time,
+        "settings_updated_at": datetime.utcnow(),
+    }
+
+    # Cache parsed datetimes as epoch timestamps on write so the admin list
+    # render doesn't strptime every exam on every page load
+    try:
+        update_data["grading_deadline_ts"] = int(
+            datetime.strptime(
+                f"{grading_deadline_date} {grading_deadline_time}", "%Y-%m-%d %H:%M"
+            ).timestamp()
+        )
+    except ValueError:
+        pass
+
+    try:
+        update_data["result_release_ts"] = int(
+            datetime.strptime(
+                f"{release_date} {release_time}", "%Y-%m-%d %H:%M"
+            ).timestamp()
+        )
+    except ValueError:
+        pass
+
     # Update the exam document
-    doc_ref.update(
-        {
-            "grading_deadline_date": grading_deadline_date,
-            "grading_deadline_time": grading_deadline_time,
-            "result_release_date": release_date,
-            "result_release_time": release_time,
-            "settings_updated_at": datetime.utcnow(),
-        }
-    )
+    doc_ref.update(update_data)
+    invalidate_exam_cache(exam_id)
 
 
 def get_all_published_exams_for_admin() -> List[Dict]:
@@ -311,7 +417,16 @@ def check_grading_locked(exam_id: str) -> tuple[bool, str, dict]:
         - details_dict: Additional information
     """
     exam = get_exam_by_id(exam_id)
+    return evaluate_grading_lock(exam)
 
+
+def evaluate_grading_lock(exam) -> tuple[bool, str, dict]:
+    """
+    Evaluate the grading-deadline lock from an already-fetched exam dict.
+
+    Split out of check_grading_locked so list pages that are iterating
+    exam docs anyway can check the lock without a read per exam.
+    """
     if not exam:
         return True, "Exam not found", {"error": "not_found"}
 
@@ -391,25 +506,43 @@ def calculate_exam_statistics(submissions: List[Dict]) -> Dict:
             "pass_rate": 0,
         }
 
-    # Extract scores
-    scores = []
+    # Single pass: accumulate sum/min/max, pass count and grade histogram
+    # together instead of re-iterating the scores for each statistic
+    passing_threshold = 50  # Pass rate (assuming 50% is passing)
+    total_students = 0
+    score_sum = 0
+    highest = None
+    lowest = None
+    passed = 0
+    grade_dist = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
+
     for sub in submissions:
-        overall_pct = sub.get("overall_percentage", 0)
-        scores.append(overall_pct)
+        score = sub.get("overall_percentage", 0)
+        total_students += 1
+        score_sum += score
 
-    # Calculate basic stats
-    total_students = len(scores)
-    average_pct = sum(scores) / total_students if total_students > 0 else 0
-    highest = max(scores) if scores else 0
-    lowest = min(scores) if scores else 0
+        if highest is None or score > highest:
+            highest = score
+        if lowest is None or score < lowest:
+            lowest = score
 
-    # Pass rate (assuming 50% is passing)
-    passing_threshold = 50
-    passed = len([s for s in scores if s >= passing_threshold])
-    pass_rate = (passed / total_students * 100) if total_students > 0 else 0
+        if score >= passing_threshold:
+            passed += 1
+
+        # Grade distribution (A: 80-100, B: 70-79, C: 60-69, D: 50-59, F: 0-49)
+        if score >= 80:
+            grade_dist["A"] += 1
+        elif score >= 70:
+            grade_dist["B"] += 1
+        elif score >= 60:
+            grade_dist["C"] += 1
+        elif score >= 50:
+            grade_dist["D"] += 1
+        else:
+            grade_dist["F"] += 1
 
-    # Grade distribution
-    grade_dist = calculate_grade_distribution(scores)
+    average_pct = score_sum / total_students
+    pass_rate = passed / total_students * 100
 
     return {
         "total_students": total_students,
@@ -472,6 +605,8 @@ def get_exams_by_lecturer(lecturer_id: str) -> list:
         exams = []
         for doc in query:
             data = doc.to_dict()
+            if data.get("is_deleted"):
+                continue
             data["exam_id"] = doc.id
             exams.append(data)
 
@@ -8,6 +8,7 @@ Handles exam scheduling, time validation, and access control
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, Tuple
 from core.firebase_db import db
+from firebase_admin import firestore
 
 MALAYSIA_TZ = timezone(timedelta(hours=8))
 
@@ -229,11 +230,22 @@ def auto_submit_exam(exam_id: str, student_id: str, answers: Dict) -> Optional[s
         "submitted_at": get_server_time(),
         "auto_submitted": True,
         "status": "completed",
+        # Same denormalized grading flags as the normal submit path
+        "mcq_graded": False,
+        "sa_graded": False,
+        "fully_graded": False,
     }
 
+    exam_ref = db.collection("exams").document(exam_id)
     doc_ref = db.collection("submissions").document()
     doc_ref.set(submission_data)
 
+    # Same counter bump as the normal submit path
+    try:
+        exam_ref.update({"total_submissions": firestore.Increment(1)})
+    except Exception as e:
+        print(f"Failed to bump total_submissions for {exam_id}: {e}")
+
     return doc_ref.id
 
 
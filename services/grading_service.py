@@ -9,6 +9,7 @@ from typing import Dict, Optional
 from datetime import datetime, timezone
 
 from core.firebase_db import db
+from firebase_admin import firestore
 from services.question_service import get_mcq_questions_by_exam
 
 
@@ -114,7 +115,18 @@ def save_grading_result(submission_id: str, grading_result: Dict) -> None:
         return
 
     doc_ref = db.collection("submissions").document(submission_id)
-    
+
+    # Read current state once so the denormalized grading flags can be
+    # kept consistent: MCQ is done now, so the submission is fully graded
+    # when short answers are done too (or it has none to grade)
+    snap = doc_ref.get()
+    existing = snap.to_dict() if snap.exists else {}
+    sa_done = existing.get("sa_grading_complete", False)
+    was_fully_graded = existing.get("fully_graded", False)
+    answers = existing.get("answers", {}) or {}
+    has_sa = any(key.startswith("sa_") for key in answers)
+    now_fully_graded = sa_done or not has_sa
+
     # 🐛 DEBUG: Print what we're saving
     print("🔍 DEBUG - Saving MCQ results:")
     print(f"  - obtained_marks: {grading_result['obtained_marks']}")
@@ -133,10 +145,26 @@ def save_grading_result(submission_id: str, grading_result: Dict) -> None:
         "overall_obtained_marks": grading_result["obtained_marks"],
         "overall_total_marks": grading_result["total_marks"],
         "overall_percentage": grading_result["percentage"],
+        # Denormalized flags queried by the admin ungraded-submissions view
+        "mcq_graded": True,
+        "sa_graded": sa_done,
+        "fully_graded": now_fully_graded,
     }
     
     doc_ref.update(update_data)
-    
+
+    # Bump the exam's graded counter the first time this submission
+    # becomes fully graded
+    if now_fully_graded and not was_fully_graded:
+        exam_id = existing.get("exam_id")
+        if exam_id:
+            try:
+                db.collection("exams").document(exam_id).update(
+                    {"graded_count": firestore.Increment(1)}
+                )
+            except Exception as e:
+                print(f"Failed to bump graded_count for {exam_id}: {e}")
+
     # 🐛 DEBUG: Verify what was saved
     saved_doc = doc_ref.get()
     if saved_doc.exists:
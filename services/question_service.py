@@ -256,6 +256,36 @@ def delete_short_answer_question(question_id: str) -> None:
         new_index += 1
 
 
+def get_question_flags(exam_id: str) -> tuple:
+    """
+    Return (has_mcq, has_short) for an exam with a single query.
+
+    Streams only the question_type field and stops as soon as both kinds
+    have been seen, replacing the two separate limit(1) round-trips the
+    individual has_* helpers cost when callers need both answers.
+    """
+    if not exam_id:
+        return False, False
+
+    has_mcq = False
+    has_short = False
+    query = (
+        db.collection("questions")
+        .where("exam_id", "==", exam_id)
+        .select(["question_type"])
+        .stream()
+    )
+    for doc in query:
+        question_type = (doc.to_dict() or {}).get("question_type")
+        if question_type == "MCQ":
+            has_mcq = True
+        elif question_type == "SA":
+            has_short = True
+        if has_mcq and has_short:
+            break
+    return has_mcq, has_short
+
+
 def has_short_for_exam(exam_id: str) -> bool:
     if not exam_id:
         return False
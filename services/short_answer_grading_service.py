@@ -9,6 +9,7 @@ from typing import Dict, List, Optional
 from datetime import datetime
 
 from core.firebase_db import db
+from firebase_admin import firestore
 
 
 def get_submissions_for_grading(exam_id: str) -> List[Dict]:
@@ -132,16 +133,35 @@ def save_short_answer_grades(submission_id: str, grades: Dict) -> None:
         (overall_obtained / overall_total * 100) if overall_total > 0 else 0
     )
 
+    mcq_done = submission_data.get("grading_result") is not None
+
     update_data.update(
         {
             "overall_total_marks": overall_total,
             "overall_obtained_marks": overall_obtained,
             "overall_percentage": round(overall_percentage, 2),
+            # Denormalized flags queried by the admin ungraded-submissions
+            # view; SA grading just completed, so fully graded iff MCQ is
+            "mcq_graded": mcq_done,
+            "sa_graded": True,
+            "fully_graded": mcq_done,
         }
     )
 
     doc_ref.update(update_data)
 
+    # Bump the exam's graded counter the first time this submission
+    # becomes fully graded
+    if mcq_done and not submission_data.get("fully_graded", False):
+        exam_id = submission_data.get("exam_id")
+        if exam_id:
+            try:
+                db.collection("exams").document(exam_id).update(
+                    {"graded_count": firestore.Increment(1)}
+                )
+            except Exception as e:
+                print(f"Failed to bump graded_count for {exam_id}: {e}")
+
 
 def get_all_submissions_for_exam(exam_id: str) -> List[Dict]:
     """
@@ -11,10 +11,16 @@ def parse_excel_data(file_content: bytes, user_type: str) -> List[Dict[str, Any]
     Parses the byte content of an Excel file into a list of user dictionaries.
     """
     try:
-        workbook = openpyxl.load_workbook(BytesIO(file_content))
+        # read_only streams rows on demand instead of materialising the
+        # whole workbook DOM; data_only substitutes cached formula values
+        workbook = openpyxl.load_workbook(
+            BytesIO(file_content), read_only=True, data_only=True
+        )
         sheet = workbook.active
 
-        headers = [cell.value.lower().strip() for cell in sheet[1]]
+        rows = sheet.iter_rows(values_only=True)
+        header_row = next(rows, ())
+        headers = [cell.lower().strip() for cell in header_row]
 
         if user_type == "lecturer":
             required_headers = ["lecturer_id", "ic", "name", "email", "faculty"]
@@ -36,12 +42,14 @@ def parse_excel_data(file_content: bytes, user_type: str) -> List[Dict[str, Any]
             raise ValueError(f"Missing required columns: {', '.join(missing)}")
 
         users = []
-        for row_index in range(2, sheet.max_row + 1):
+        for row in rows:
             user_data = {}
             row_is_empty = True
 
             for col_index, header in enumerate(headers):
-                value = sheet.cell(row=row_index, column=col_index + 1).value
+                # Streamed rows can be shorter than the header row;
+                # missing trailing cells read as None like before
+                value = row[col_index] if col_index < len(row) else None
                 if value is not None:
                     row_is_empty = False
 
@@ -58,6 +66,8 @@ def parse_excel_data(file_content: bytes, user_type: str) -> List[Dict[str, Any]
                     final_user_data = {k: user_data.get(k) for k in required_headers}
                     users.append(final_user_data)
 
+        workbook.close()
+
         if not users:
             raise ValueError("No valid user records found in the Excel file.")
 
@@ -74,6 +84,7 @@ def bulk_create_users(users: List[Dict[str, Any]], user_type: str) -> Dict[str,
     """
     stats = {"total": len(users), "created": 0, "updated": 0, "failed": 0, "errors": []}
     firestore_batch = db.batch()
+    ops_in_batch = 0
 
     for user in users:
         email = user["email"]
@@ -131,8 +142,19 @@ def bulk_create_users(users: List[Dict[str, Any]], user_type: str) -> Dict[str,
 
         user_doc_ref = db.collection("users").document(user_id)
         firestore_batch.set(user_doc_ref, profile_data, merge=True)
+        ops_in_batch += 1
+
+        # Firestore batches cap at 500 operations; flush and start a new
+        # one so imports larger than that don't fail the whole commit
+        if ops_in_batch >= 500:
+            try:
+                firestore_batch.commit()
+            except Exception as e:
+                stats["errors"].append(f"Firestore Batch Error: {str(e)}")
+            firestore_batch = db.batch()
+            ops_in_batch = 0
 
-    # Commit Firestore changes
+    # Commit remaining Firestore changes
     try:
         firestore_batch.commit()
     except Exception as e:
@@ -29,10 +29,13 @@ class AdminLecturerListTest(unittest.TestCase):
             "ic": "789012",
         }
 
-        # 2. Setup the chain: db.collection().where().stream()
+        # 2. Setup the chain: db.collection().where().select().order_by().stream()
         mock_query = MagicMock()
         mock_query.stream.return_value = [mock_lecturer_1, mock_lecturer_2]
 
+        mock_query.select.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+
         mock_where = MagicMock()
         mock_where.where.return_value = mock_query
         mock_collection.return_value = mock_where
@@ -68,6 +71,9 @@ class AdminLecturerListTest(unittest.TestCase):
         mock_query = MagicMock()
         mock_query.stream.return_value = []
 
+        mock_query.select.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+
         mock_where = MagicMock()
         mock_where.where.return_value = mock_query
         mock_collection.return_value = mock_where
@@ -23,7 +23,10 @@ class TestAdminLecturerSearch(unittest.TestCase):
             "faculty": "Engineering"
         }
         # Simulate Firestore finding this lecturer by name
-        mock_db.collection.return_value.where.return_value.stream.return_value = [mock_doc]
+        mock_query = mock_db.collection.return_value.where.return_value
+        mock_query.select.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.stream.return_value = [mock_doc]
 
         response, status = get_admin_lecturer_list()
 
@@ -41,7 +44,10 @@ class TestAdminLecturerSearch(unittest.TestCase):
             "faculty": "Accounting"
         }
         # Simulate Firestore finding this lecturer by ID
-        mock_db.collection.return_value.where.return_value.stream.return_value = [mock_doc]
+        mock_query = mock_db.collection.return_value.where.return_value
+        mock_query.select.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.stream.return_value = [mock_doc]
 
         response, status = get_admin_lecturer_list()
 
@@ -62,7 +68,10 @@ class TestAdminLecturerSearch(unittest.TestCase):
             "major": "Business Administration"
         }
         # Simulate Firestore finding this student by name
-        mock_db.collection.return_value.where.return_value.stream.return_value = [mock_doc]
+        mock_query = mock_db.collection.return_value.where.return_value
+        mock_query.select.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.stream.return_value = [mock_doc]
 
         response, status = get_admin_student_list()
 
@@ -80,7 +89,10 @@ class TestAdminLecturerSearch(unittest.TestCase):
             "major": "Computer Science"
         }
         # Simulate Firestore finding this student by ID
-        mock_db.collection.return_value.where.return_value.stream.return_value = [mock_doc]
+        mock_query = mock_db.collection.return_value.where.return_value
+        mock_query.select.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.stream.return_value = [mock_doc]
 
         response, status = get_admin_student_list()
 
@@ -33,10 +33,13 @@ class AdminStudentListTest(unittest.TestCase):
             "ic": "002",
         }
 
-        # 2. Setup the chain: db.collection().where().stream()
+        # 2. Setup the chain: db.collection().where().select().order_by().stream()
         mock_query = MagicMock()
         mock_query.stream.return_value = [mock_student_1, mock_student_2]
 
+        mock_query.select.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+
         mock_where = MagicMock()
         mock_where.where.return_value = mock_query
 
@@ -69,6 +72,9 @@ class AdminStudentListTest(unittest.TestCase):
         mock_query = MagicMock()
         mock_query.stream.return_value = []  # Empty list
 
+        mock_query.select.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+
         mock_where = MagicMock()
         mock_where.where.return_value = mock_query
         mock_collection.return_value = mock_where
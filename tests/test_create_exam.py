@@ -23,9 +23,8 @@ class ExamHandlerTest(unittest.TestCase):
 
     # --- Test 1: Success Case (Save/Update Draft via post_submit_exam) ---
 
-    # Mock services used to determine the review page buttons
-    @patch("web.exams.has_short_for_exam", return_value=False)
-    @patch("web.exams.has_mcq_for_exam", return_value=True)
+    # Mock the combined question-flags lookup for the review page buttons
+    @patch("web.exams.get_question_flags", return_value=(True, False))
     # Mock the save function, returning a faked ID
     @patch("web.exams.save_exam_draft", return_value="test_exam_103")
     # Mock external validation, returning no errors
@@ -39,8 +38,7 @@ class ExamHandlerTest(unittest.TestCase):
         mock_validate_exam,
         mock_validate_date,
         mock_save_draft,
-        mock_has_mcq,
-        mock_has_short,
+        mock_question_flags,
     ):
         """Test case for a successful exam draft submission (Expects 200 and calls save_exam_draft)."""
 
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import patch
+
+from web.exams import get_exam_list_conditional
+
+
+class ExamListConditionalTests(unittest.TestCase):
+    """
+    Tests for the ETag revalidation wrapper around get_exam_list: a
+    matching If-None-Match must short-circuit to an empty 304 without
+    rendering, and a stale validator must produce the full page.
+    """
+
+    @patch("web.exams.get_exam_list", return_value=("<html>list</html>", 200))
+    def test_matching_validator_returns_304_and_skips_render(self, mock_list):
+        html_str, status, etag = get_exam_list_conditional(None)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(html_str, "<html>list</html>")
+        self.assertTrue(etag.startswith('W/"exam-list-'))
+        mock_list.assert_called_once()
+
+        html_str, status, etag_2 = get_exam_list_conditional(etag)
+
+        self.assertEqual(status, 304)
+        self.assertEqual(html_str, "")
+        self.assertEqual(etag_2, etag)
+        # Still only the first call rendered; the revalidation skipped it
+        mock_list.assert_called_once()
+
+    @patch("web.exams.get_exam_list", return_value=("<html>list</html>", 200))
+    def test_stale_validator_renders_the_full_page(self, mock_list):
+        html_str, status, etag = get_exam_list_conditional('W/"exam-list-stale"')
+
+        self.assertEqual(status, 200)
+        self.assertEqual(html_str, "<html>list</html>")
+        self.assertNotEqual(etag, 'W/"exam-list-stale"')
+        mock_list.assert_called_once()
+
+    @patch("web.exams.get_exam_list", return_value=("<html>list</html>", 200))
+    def test_etag_varies_with_search_and_sort_scope(self, mock_list):
+        _, _, etag_default = get_exam_list_conditional(None)
+        _, _, etag_search = get_exam_list_conditional(None, search="midterm")
+        _, _, etag_sort = get_exam_list_conditional(None, sort="title")
+
+        self.assertNotEqual(etag_default, etag_search)
+        self.assertNotEqual(etag_default, etag_sort)
+        self.assertNotEqual(etag_search, etag_sort)
+
+    @patch("web.exams.get_exam_list", return_value=("<html>list</html>", 200))
+    def test_validator_is_invalidated_by_exam_writes(self, mock_list):
+        from services.exam_service import invalidate_exam_cache
+
+        _, _, etag = get_exam_list_conditional(None)
+        invalidate_exam_cache("E1")
+        _, status, etag_after = get_exam_list_conditional(etag)
+
+        self.assertEqual(status, 200)
+        self.assertNotEqual(etag_after, etag)
+
+
+if __name__ == "__main__":
+    unittest.main()
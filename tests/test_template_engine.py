@@ -0,0 +1,98 @@
+import unittest
+
+from web import template_engine
+from web.template_engine import render, render_parts, render_stream
+
+
+class TemplateEngineRenderingTests(unittest.TestCase):
+    """
+    Characterization tests for the compiled template engine: variable
+    escaping, |safe and _html/_json suffix handling, conditional blocks,
+    unknown-placeholder passthrough and the fragment-based render paths.
+    """
+
+    TPL = "_engine_test.html"
+
+    def tearDown(self):
+        template_engine._TEMPLATE_CACHE.pop(self.TPL, None)
+        template_engine._COMPILED_CACHE.pop(self.TPL, None)
+
+    def _render(self, source: str, ctx: dict) -> str:
+        # Inject the template source through the cache so the test does
+        # not need a file on disk; tearDown removes both cache entries
+        template_engine._TEMPLATE_CACHE[self.TPL] = source
+        template_engine._COMPILED_CACHE.pop(self.TPL, None)
+        return template_engine._render_content(self.TPL, ctx)
+
+    # ------------------------------------------------------------------
+    # Variable substitution and escaping
+    # ------------------------------------------------------------------
+
+    def test_variable_values_are_html_escaped(self):
+        out = self._render("<p>{{name}}</p>", {"name": "<b>&\"'x"})
+        self.assertEqual(out, "<p>&lt;b&gt;&amp;&quot;&#x27;x</p>")
+
+    def test_safe_filter_passes_markup_through_raw(self):
+        out = self._render("{{banner|safe}}", {"banner": "<div>ok</div>"})
+        self.assertEqual(out, "<div>ok</div>")
+
+    def test_html_and_json_suffix_keys_pass_through_raw(self):
+        out = self._render(
+            "{{rows_html}}|{{filters_json}}",
+            {"rows_html": "<tr></tr>", "filters_json": '{"a": 1}'},
+        )
+        self.assertEqual(out, '<tr></tr>|{"a": 1}')
+
+    def test_unknown_placeholder_is_echoed_back_verbatim(self):
+        out = self._render("<p>{{missing}}</p>", {})
+        self.assertEqual(out, "<p>{{missing}}</p>")
+
+    def test_optional_keys_are_dropped_when_absent(self):
+        out = self._render("a{{errors_html}}b{{success_html}}c", {})
+        self.assertEqual(out, "abc")
+
+    def test_non_string_values_are_stringified(self):
+        out = self._render("{{duration}} min", {"duration": 60})
+        self.assertEqual(out, "60 min")
+
+    # ------------------------------------------------------------------
+    # Conditional blocks
+    # ------------------------------------------------------------------
+
+    def test_if_block_renders_body_for_truthy_variable(self):
+        source = "x{% if flag %}yes{% endif %}y"
+        self.assertEqual(self._render(source, {"flag": "1"}), "xyesy")
+        self.assertEqual(self._render(source, {"flag": ""}), "xy")
+        self.assertEqual(self._render(source, {}), "xy")
+
+    def test_if_else_block_selects_the_right_branch(self):
+        source = "{% if flag %}on{% else %}off{% endif %}"
+        self.assertEqual(self._render(source, {"flag": "1"}), "on")
+        self.assertEqual(self._render(source, {"flag": ""}), "off")
+        self.assertEqual(self._render(source, {}), "off")
+
+    def test_variables_inside_conditionals_still_escape(self):
+        source = "{% if who %}<b>{{who}}</b>{% endif %}"
+        self.assertEqual(self._render(source, {"who": "<i>"}), "<b>&lt;i&gt;</b>")
+
+    # ------------------------------------------------------------------
+    # Fragment-based render paths
+    # ------------------------------------------------------------------
+
+    def test_render_parts_joined_matches_render(self):
+        template_engine._TEMPLATE_CACHE[self.TPL] = "<p>{{name}}</p>"
+        template_engine._COMPILED_CACHE.pop(self.TPL, None)
+        ctx = {"name": "Alice & Bob"}
+        self.assertEqual("".join(render_parts(self.TPL, ctx)), render(self.TPL, ctx))
+
+    def test_render_stream_splices_fragments_in_place(self):
+        template_engine._TEMPLATE_CACHE[self.TPL] = "<ul>{{rows_html}}</ul>"
+        template_engine._COMPILED_CACHE.pop(self.TPL, None)
+        fragments = ["<li>a</li>", "<li>b</li>"]
+        streamed = "".join(render_stream(self.TPL, {}, "rows_html", fragments))
+        joined = render(self.TPL, {"rows_html": "".join(fragments)})
+        self.assertEqual(streamed, joined)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,31 @@ from services.admin_performance_report_service import get_exam_performance_repor
 from .template_engine import render
 
 
+# Row templates for the performance tables, defined once per process so the
+# per-student loops only do the cheap format_map fills
+_TOP_PERFORMER_ROW_TPL = """
+            <tr>
+                <td>{medal} {rank}</td>
+                <td>{student_id}</td>
+                <td><strong>{percentage}%</strong></td>
+                <td>{total_marks}</td>
+                <td>{mcq_score}</td>
+                <td>{sa_score}</td>
+            </tr>
+            """
+
+_AT_RISK_ROW_TPL = """
+            <tr>
+                <td>{student_id}</td>
+                <td><span class="badge bg-danger">{percentage}%</span></td>
+                <td>{total_marks}</td>
+                <td><small>{concerns}</small></td>
+            </tr>
+            """
+
+_MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+
 def get_performance_report(exam_id: str):
     """
     GET handler for exam performance report
@@ -158,45 +183,44 @@ def get_performance_report(exam_id: str):
     # ==========================================
     # FIX: Build top performers table HTML
     # ==========================================
-    top_performers_html = ""
     if top_performers:
+        rows = []
         for rank, performer in enumerate(top_performers, start=1):
-            medal = ""
-            if rank == 1:
-                medal = "🥇"
-            elif rank == 2:
-                medal = "🥈"
-            elif rank == 3:
-                medal = "🥉"
-
-            top_performers_html += f"""
-            <tr>
-                <td>{medal} {rank}</td>
-                <td>{html.escape(performer.get('student_id', 'N/A'))}</td>
-                <td><strong>{performer.get('percentage', 0)}%</strong></td>
-                <td>{performer.get('total_marks', 0)}</td>
-                <td>{performer.get('mcq_score', 0)}</td>
-                <td>{performer.get('sa_score', 0)}</td>
-            </tr>
-            """
+            medal = _MEDALS.get(rank, "")
+            rows.append(
+                _TOP_PERFORMER_ROW_TPL.format_map(
+                    {
+                        "medal": medal,
+                        "rank": rank,
+                        "student_id": html.escape(performer.get("student_id", "N/A")),
+                        "percentage": performer.get("percentage", 0),
+                        "total_marks": performer.get("total_marks", 0),
+                        "mcq_score": performer.get("mcq_score", 0),
+                        "sa_score": performer.get("sa_score", 0),
+                    }
+                )
+            )
+        top_performers_html = "".join(rows)
     else:
         top_performers_html = '<tr><td colspan="6" class="text-center text-muted py-4">No top performers data available.</td></tr>'
 
     # ==========================================
     # FIX: Build at-risk students table HTML
     # ==========================================
-    at_risk_html = ""
     if students_at_risk:
-        for student in students_at_risk:
-            concerns = ", ".join(student.get("areas_of_concern", []))
-            at_risk_html += f"""
-            <tr>
-                <td>{html.escape(student.get('student_id', 'N/A'))}</td>
-                <td><span class="badge bg-danger">{student.get('percentage', 0)}%</span></td>
-                <td>{student.get('total_marks', 0)}</td>
-                <td><small>{html.escape(concerns)}</small></td>
-            </tr>
-            """
+        at_risk_html = "".join(
+            _AT_RISK_ROW_TPL.format_map(
+                {
+                    "student_id": html.escape(student.get("student_id", "N/A")),
+                    "percentage": student.get("percentage", 0),
+                    "total_marks": student.get("total_marks", 0),
+                    "concerns": html.escape(
+                        ", ".join(student.get("areas_of_concern", []))
+                    ),
+                }
+            )
+            for student in students_at_risk
+        )
     else:
         at_risk_html = '<tr><td colspan="4" class="text-center text-muted py-4">No at-risk students identified.</td></tr>'
 
@@ -1,190 +1,230 @@
-from urllib.parse import parse_qs
+from urllib.parse import parse_qsl, quote
 import html
+import secrets
+import threading
+import time
 import json
+import datetime as _dt
 from datetime import datetime
 from typing import Optional
+from google.api_core.exceptions import NotFound
 from services.user_service import parse_excel_data, bulk_create_users
-from core.validation import validate_result_release_date, validate_grading_periods
+from core.validation import (
+    required_grading_field_errors,
+    validate_grading_periods,
+    validate_result_release_date,
+)
 from services.exam_service import (
+    exam_data_version,
     get_all_published_exams_for_admin,
     get_exam_by_id,
     set_result_release_date,
     save_grading_settings,
 )
-from web.template_engine import render
+from web.template_engine import render, render_stream
 from core.firebase_db import db
 
 
-def _parse_form(body: str) -> dict:
-    """Parse form data from POST request"""
-    data = parse_qs(body)
+# ============================================================
+# STATIC ALERT MARKUP
+# Built once per process; handlers fill in the exam id via
+# format_map instead of re-assembling the markup per request.
+# ============================================================
+
+_ERR_MISSING_ID_HTML = (
+    '<div class="alert alert-danger mb-3"><strong>Error:</strong> Exam ID is missing.</div>'
+)
+
+_ERR_MISSING_ID_SHORT_HTML = '<div class="alert alert-danger">Missing exam ID</div>'
+
+_ERR_NOT_FOUND_TPL = '<div class="alert alert-danger">Exam "{exam_id}" not found.</div>'
+
+_ERR_NOT_FOUND_STRONG_TPL = (
+    '<div class="alert alert-danger mb-3"><strong>Error:</strong> Exam "{exam_id}" not found.</div>'
+)
+
+_RELEASE_SAVED_HTML = """
+        <div class="alert alert-success mb-3">
+            <strong>Success!</strong> Result release date has been set.
+            <a href="/admin/exam-list" class="alert-link">Return to exam list</a>
+        </div>
+        """
+
+_IMPORT_NO_FILE_HTML = """
+        <div class="alert alert-danger">
+            <strong>Upload Failed:</strong> Please select an Excel file for import.
+        </div>
+        """
+
+_IMPORT_EMPTY_FILE_HTML = """
+        <div class="alert alert-danger">
+            <strong>Upload Failed:</strong> File content was empty or unreadable by the server.
+        </div>
+        """
+
+_SETTINGS_SAVED_HTML = """
+        <div class="alert alert-success mb-3">
+            <h5 class="alert-heading"> Settings Saved Successfully!</h5>
+            <hr>
+            <p class="mb-0">
+                Grading deadline and result release dates have been configured.
+                <a href="/admin/exam-list" class="alert-link fw-bold">Return to exam list</a>
+            </p>
+        </div>
+        """
+
+
+# Shared page shell for the admin list error pages; the per-request parts
+# (heading, message, back link) are filled in via format_map.
+_LIST_ERROR_PAGE_TPL = """
+        <div class="container mt-5">
+            <div class="alert alert-danger">
+                <h4>{heading}</h4>
+                <p>{message}</p>
+                <a href="{back_href}" class="btn btn-secondary">Back</a>
+            </div>
+        </div>
+        """
+
+
+def _escaped_list_items(items: list) -> str:
+    """
+    Render a list of strings as escaped <li> elements.
+
+    Escapes via a single map/join pass instead of evaluating an f-string
+    per item, which matters when validation returns many messages.
+    """
+    if not items:
+        return ""
+    return "<li>" + "</li><li>".join(map(html.escape, items)) + "</li>"
 
-    def get_field(key: str) -> str:
-        return data.get(key, [""])[0]
+
+def _parse_form(body: str) -> dict:
+    """Parse the result-release form body (single-valued fields only)"""
+    # These forms only carry single-valued fields, so parse_qsl avoids the
+    # per-key list wrapping of parse_qs; max_num_fields caps abuse
+    data = dict(parse_qsl(body, max_num_fields=32))
 
     return {
-        "exam_id": get_field("exam_id"),
-        "release_date": get_field("release_date"),
-        "release_time": get_field("release_time"),
+        "exam_id": data.get("exam_id", ""),
+        "release_date": data.get("release_date", ""),
+        "release_time": data.get("release_time", ""),
     }
 
 
 def _parse_grading_form(body: str) -> dict:
-    """Parse grading settings form data"""
-    data = parse_qs(body)
-
-    def get_field(key: str) -> str:
-        return data.get(key, [""])[0]
+    """Parse the grading-settings form body (single-valued fields only)"""
+    data = dict(parse_qsl(body, max_num_fields=32))
 
     return {
-        "exam_id": get_field("exam_id"),
-        "grading_deadline_date": get_field("grading_deadline_date"),
-        "grading_deadline_time": get_field("grading_deadline_time"),
-        "release_date": get_field("release_date"),
-        "release_time": get_field("release_time"),
+        "exam_id": data.get("exam_id", ""),
+        "grading_deadline_date": data.get("grading_deadline_date", ""),
+        "grading_deadline_time": data.get("grading_deadline_time", ""),
+        "release_date": data.get("release_date", ""),
+        "release_time": data.get("release_time", ""),
     }
 
 
-def get_admin_exam_list():
-    """
-    GET handler for admin exam list with result release date management
-    Shows grading deadline status and result release status
-    """
-    all_exams = get_all_published_exams_for_admin()
+# The published-exam list is refetched from Firestore on every page load
+# even though concurrent admin tabs see the same data; keep it briefly and
+# drop it whenever a write path changes an exam.
+# "version" backs the exam-list ETag: it only advances when a refetch
+# returns different data (or a write invalidates the cache), so browsers
+# holding the current version get 304s instead of a re-rendered page.
+_EXAM_LIST_CACHE = {"ts": 0.0, "data": None, "version": 0}
+_EXAM_LIST_CACHE_TTL = 15  # seconds
+_EXAM_LIST_LOCK = threading.Lock()
+
+
+def _get_published_exams_cached() -> list:
+    """Fetch the admin exam list with a short per-process TTL cache"""
+    with _EXAM_LIST_LOCK:
+        cached = _EXAM_LIST_CACHE["data"]
+        if (
+            cached is not None
+            and time.monotonic() - _EXAM_LIST_CACHE["ts"] < _EXAM_LIST_CACHE_TTL
+        ):
+            return cached
 
-    exam_list_html = ""
+    exams = get_all_published_exams_for_admin()
 
-    if not all_exams:
-        exam_list_html = """
-        <div class="alert alert-info">
-            <h5>No published exams found</h5>
-            <p class="mb-0">Only published exams appear here for result management.</p>
-        </div>
-        """
-    else:
-        for exam in all_exams:
-            e_id = exam.get("exam_id", "")
-            title = html.escape(exam.get("title", "Untitled"))
-            description = html.escape(exam.get("description", "No description"))
-            duration = exam.get("duration", 0)
-            exam_date = exam.get("exam_date", "N/A")
-
-            # Get time information
-            start_time = exam.get("start_time", "N/A")
-            end_time = exam.get("end_time", "N/A")
-
-            # ========================================
-            # GRADING DEADLINE STATUS
-            # ========================================
-            grading_deadline = exam.get("grading_deadline_date", "")
-            grading_time = exam.get("grading_deadline_time", "23:59")
-
-            # Initialize flag to track if grading is allowed
-            is_grading_closed = False
-
-            if grading_deadline:
-                try:
-                    deadline_str = f"{grading_deadline} {grading_time}"
-                    deadline_dt = datetime.strptime(deadline_str, "%Y-%m-%d %H:%M")
-                    now = datetime.now()
+    # Don't cache empty results; a list that is briefly empty (or a failed
+    # fetch) shouldn't mask newly published exams for the TTL window
+    if exams:
+        with _EXAM_LIST_LOCK:
+            if exams != _EXAM_LIST_CACHE["data"]:
+                _EXAM_LIST_CACHE["version"] += 1
+            _EXAM_LIST_CACHE["ts"] = time.monotonic()
+            _EXAM_LIST_CACHE["data"] = exams
 
-                    if now > deadline_dt:
-                        grading_status = '<span class="badge bg-danger ms-2">🔒 Grading Closed</span>'
-                        grading_display = (
-                            f"Closed on {grading_deadline} at {grading_time}"
-                        )
-                        is_grading_closed = True
-                    else:
-                        # Calculate time remaining
-                        time_remaining = deadline_dt - now
-                        days_remaining = time_remaining.days
-                        hours_remaining = time_remaining.seconds // 3600
-
-                        if days_remaining == 0 and hours_remaining < 24:
-                            grading_status = f'<span class="badge bg-danger ms-2">⚠️ {hours_remaining}h Left</span>'
-                        elif days_remaining < 2:
-                            grading_status = f'<span class="badge bg-warning text-dark ms-2">⏰ {days_remaining}d Left</span>'
-                        else:
-                            grading_status = f'<span class="badge bg-info ms-2">✓ {days_remaining}d Left</span>'
-
-                        grading_display = (
-                            f"Open until {grading_deadline} at {grading_time}"
-                        )
+    return exams
 
-                except ValueError:
-                    grading_status = (
-                        '<span class="badge bg-secondary ms-2">❌ Invalid Date</span>'
-                    )
-                    grading_display = (
-                        f"{grading_deadline} at {grading_time} (Invalid format)"
-                    )
-            else:
-                grading_status = (
-                    '<span class="badge bg-secondary ms-2">No Deadline</span>'
-                )
-                grading_display = "Not set"
 
-            # ========================================
-            # RESULT RELEASE STATUS
-            # ========================================
-            release_date = exam.get("result_release_date", "")
-            release_time = exam.get("result_release_time", "00:00")
+def _invalidate_exam_list_cache() -> None:
+    with _EXAM_LIST_LOCK:
+        _EXAM_LIST_CACHE["ts"] = 0.0
+        _EXAM_LIST_CACHE["data"] = None
+        _EXAM_LIST_CACHE["version"] += 1
 
-            if release_date:
-                try:
-                    release_datetime_str = f"{release_date} {release_time}"
-                    release_dt = datetime.strptime(
-                        release_datetime_str, "%Y-%m-%d %H:%M"
-                    )
-                    now = datetime.now()
 
-                    if now >= release_dt:
-                        release_status = '<span class="badge bg-success ms-2">✅ Results Released</span>'
-                    else:
-                        release_status = '<span class="badge bg-warning text-dark ms-2">📅 Scheduled</span>'
-                except ValueError:
-                    release_status = (
-                        '<span class="badge bg-secondary ms-2">❌ Invalid Date</span>'
-                    )
-            else:
-                release_status = '<span class="badge bg-secondary ms-2">Not Set</span>'
+# The version counters restart at zero with the process, but browser
+# caches outlive it; a per-process nonce keeps validators from different
+# runs from ever colliding into a false 304
+_ETAG_NONCE = secrets.token_hex(4)
 
-            release_display = (
-                f"{release_date} at {release_time}" if release_date else "Not set"
-            )
 
-            # ========================================
-            # CHECK IF RESULTS ARE FINALIZED
-            # ========================================
-            is_finalized = exam.get("results_finalized", False)
-            finalized_badge = ""
-            if is_finalized:
-                finalized_at = exam.get("finalized_at", "")
-                if finalized_at and hasattr(finalized_at, "strftime"):
-                    finalized_at_str = finalized_at.strftime("%Y-%m-%d %H:%M")
-                else:
-                    finalized_at_str = str(finalized_at)
-                finalized_badge = f'<span class="badge bg-dark ms-2">✓ Finalized on {finalized_at_str}</span>'
-                # If finalized, grading is definitely closed regardless of deadline
-                is_grading_closed = True
-
-            # ========================================
-            # BUILD EXAM CARD HTML
-            # ========================================
-
-            # Conditional Logic for Grading Button
-            # If grading is closed, REMOVE the button entirely.
-            if is_grading_closed:
-                grade_button_html = ""
-            else:
-                grade_button_html = f"""
-                <a href="/grade-submissions?exam_id={e_id}"
+def _exam_list_etag() -> str:
+    """Current ETag for the admin exam list (weak; per-process versions)"""
+    # Fold in the exam_service write counter as well: publish/delete go
+    # through exam_service without touching _EXAM_LIST_CACHE, and the 304
+    # short-circuit returns before any refetch could notice the change
+    with _EXAM_LIST_LOCK:
+        return 'W/"exam-list-{}-{}-{}"'.format(
+            _ETAG_NONCE, _EXAM_LIST_CACHE["version"], exam_data_version()
+        )
+
+
+# Hoisted once per process: the Grade Submissions button only varies by the
+# (already URL-encoded) exam id, so per-card work is a single format call
+_GRADE_BUTTON_TPL = """
+                <a href="/grade-submissions?exam_id={exam_id}"
                    class="btn btn-sm btn-success">
                    Grade Submissions
                 </a>
                 """
 
-            exam_list_html += f"""
+# Status badges for the exam list, defined once instead of rebuilt as
+# (f-)string literals on every loop iteration. The *_TPL entries still
+# take a .format call; the rest are fixed markup shared by every card.
+_BADGE_GRADING_CLOSED = '<span class="badge bg-danger ms-2">🔒 Grading Closed</span>'
+_BADGE_HOURS_LEFT_TPL = '<span class="badge bg-danger ms-2">⚠️ {hours}h Left</span>'
+_BADGE_DAYS_LEFT_SOON_TPL = (
+    '<span class="badge bg-warning text-dark ms-2">⏰ {days}d Left</span>'
+)
+_BADGE_DAYS_LEFT_TPL = '<span class="badge bg-info ms-2">✓ {days}d Left</span>'
+_BADGE_INVALID_DATE = '<span class="badge bg-secondary ms-2">❌ Invalid Date</span>'
+_BADGE_NO_DEADLINE = '<span class="badge bg-secondary ms-2">No Deadline</span>'
+_BADGE_RELEASED = '<span class="badge bg-success ms-2">✅ Results Released</span>'
+_BADGE_SCHEDULED = '<span class="badge bg-warning text-dark ms-2">📅 Scheduled</span>'
+_BADGE_NOT_SET = '<span class="badge bg-secondary ms-2">Not Set</span>'
+_BADGE_FINALIZED_TPL = (
+    '<span class="badge bg-dark ms-2">✓ Finalized on {finalized_at}</span>'
+)
+
+# Row fragments shared by the student and lecturer list loops; the badge,
+# row class and button styling are identical for every row, so allocate
+# each string once instead of per iteration.
+_ACTIVE_BADGE = '<span class="badge bg-success ms-2">Active</span>'
+_INACTIVE_BADGE = '<span class="badge bg-secondary ms-2">Inactive</span>'
+_ROW_INACTIVE_CLASS = "table-secondary text-muted"
+_BTN_DEACTIVATE = ("Deactivate", "btn-outline-danger")
+_BTN_REACTIVATE = ("Reactivate", "btn-success")
+
+# Whole exam card as one module-level template. The home-grown engine has
+# no {% for %} support, so the loop stays in Python, but each iteration is
+# now a single format_map over precomputed values instead of evaluating a
+# ~40-line f-string.
+_EXAM_CARD_TPL = """
             <div class="exam-card">
                 <div class="exam-info">
                     <h5 class="exam-title">
@@ -210,14 +250,14 @@ def get_admin_exam_list():
                 </div>
 
                 <div class="exam-actions d-flex flex-column gap-2">
-                    <a href="/admin/grading-settings?exam_id={e_id}"
+                    <a href="/admin/grading-settings?exam_id={e_id_q}"
                        class="btn btn-sm btn-primary">
                        ⚙️ Settings
                     </a>
 
                     {grade_button_html}
                     
-                    <a href="/admin/performance-report?exam_id={e_id}"
+                    <a href="/admin/performance-report?exam_id={e_id_q}"
                        class="btn btn-sm btn-info">
                        📊 View Performance
                     </a>
@@ -225,10 +265,232 @@ def get_admin_exam_list():
             </div>
             """
 
+
+def _exam_list_fragments() -> list:
+    """
+    Build the HTML fragments for the admin exam list body.
+
+    Returns one chunk per exam card (or a single empty-state block) so
+    callers can either join them for a plain render or stream them out
+    one at a time.
+    """
+    all_exams = _get_published_exams_cached()
+
+    if not all_exams:
+        return [
+            """
+        <div class="alert alert-info">
+            <h5>No published exams found</h5>
+            <p class="mb-0">Only published exams appear here for result management.</p>
+        </div>
+        """
+        ]
+
+    # Collect cards in a list; callers join once or stream them as-is,
+    # never += onto a growing string
+    card_parts = []
+
+    # One wall-clock read per request; every deadline/release comparison
+    # below is against the same instant
+    now = datetime.now()
+    now_ts = now.timestamp()
+
+    # Each exam field is probed exactly once per iteration and bound to a
+    # local; every later use is a LOAD_FAST, which beats both repeated
+    # dict.get chains and attribute access on a per-exam view object
+    for exam in all_exams:
+        e_id = exam.get("exam_id", "")
+        # URL-encode once per card; e_id is reused in three links below
+        e_id_q = quote(e_id, safe="")
+        title = html.escape(exam.get("title", "Untitled"))
+        description = html.escape(exam.get("description", "No description"))
+        duration = exam.get("duration", 0)
+        exam_date = exam.get("exam_date", "N/A")
+
+        # Get time information
+        start_time = exam.get("start_time", "N/A")
+        end_time = exam.get("end_time", "N/A")
+
+        # ========================================
+        # GRADING DEADLINE STATUS
+        # ========================================
+        grading_deadline = exam.get("grading_deadline_date", "")
+        grading_time = exam.get("grading_deadline_time", "23:59")
+
+        # Initialize flag to track if grading is allowed
+        is_grading_closed = False
+
+        if grading_deadline:
+            try:
+                # Prefer the epoch timestamp written on save; older exams
+                # without it fall back to parsing the string fields
+                deadline_ts = exam.get("grading_deadline_ts")
+                if deadline_ts is not None:
+                    secs_remaining = int(deadline_ts - now_ts)
+                else:
+                    deadline_str = f"{grading_deadline} {grading_time}"
+                    deadline_dt = datetime.strptime(deadline_str, "%Y-%m-%d %H:%M")
+                    secs_remaining = int((deadline_dt - now).total_seconds())
+
+                if secs_remaining < 0:
+                    grading_status = _BADGE_GRADING_CLOSED
+                    grading_display = (
+                        f"Closed on {grading_deadline} at {grading_time}"
+                    )
+                    is_grading_closed = True
+                else:
+                    # Calculate time remaining
+                    days_remaining = secs_remaining // 86400
+                    hours_remaining = (secs_remaining % 86400) // 3600
+
+                    if days_remaining == 0 and hours_remaining < 24:
+                        grading_status = _BADGE_HOURS_LEFT_TPL.format(
+                            hours=hours_remaining
+                        )
+                    elif days_remaining < 2:
+                        grading_status = _BADGE_DAYS_LEFT_SOON_TPL.format(
+                            days=days_remaining
+                        )
+                    else:
+                        grading_status = _BADGE_DAYS_LEFT_TPL.format(
+                            days=days_remaining
+                        )
+
+                    grading_display = (
+                        f"Open until {grading_deadline} at {grading_time}"
+                    )
+
+            except ValueError:
+                grading_status = _BADGE_INVALID_DATE
+                grading_display = (
+                    f"{grading_deadline} at {grading_time} (Invalid format)"
+                )
+        else:
+            grading_status = _BADGE_NO_DEADLINE
+            grading_display = "Not set"
+
+        # ========================================
+        # RESULT RELEASE STATUS
+        # ========================================
+        release_date = exam.get("result_release_date", "")
+        release_time = exam.get("result_release_time", "00:00")
+
+        if release_date:
+            try:
+                release_ts = exam.get("result_release_ts")
+                if release_ts is not None:
+                    released = now_ts >= release_ts
+                else:
+                    release_datetime_str = f"{release_date} {release_time}"
+                    release_dt = datetime.strptime(
+                        release_datetime_str, "%Y-%m-%d %H:%M"
+                    )
+                    released = now >= release_dt
+
+                if released:
+                    release_status = _BADGE_RELEASED
+                else:
+                    release_status = _BADGE_SCHEDULED
+            except ValueError:
+                release_status = _BADGE_INVALID_DATE
+        else:
+            release_status = _BADGE_NOT_SET
+
+        release_display = (
+            f"{release_date} at {release_time}" if release_date else "Not set"
+        )
+
+        # ========================================
+        # CHECK IF RESULTS ARE FINALIZED
+        # ========================================
+        is_finalized = exam.get("results_finalized", False)
+        finalized_badge = ""
+        if is_finalized:
+            finalized_at = exam.get("finalized_at", "")
+            # isinstance goes through the _dt alias so the check still
+            # sees the real type when tests patch this module's datetime
+            if isinstance(finalized_at, _dt.datetime):
+                finalized_at_str = finalized_at.strftime("%Y-%m-%d %H:%M")
+            else:
+                finalized_at_str = str(finalized_at)
+            finalized_badge = _BADGE_FINALIZED_TPL.format(
+                finalized_at=finalized_at_str
+            )
+            # If finalized, grading is definitely closed regardless of deadline
+            is_grading_closed = True
+
+        # ========================================
+        # BUILD EXAM CARD HTML
+        # ========================================
+
+        # Conditional Logic for Grading Button
+        # If grading is closed, REMOVE the button entirely.
+        if is_grading_closed:
+            grade_button_html = ""
+        else:
+            grade_button_html = _GRADE_BUTTON_TPL.format(exam_id=e_id_q)
+
+        card_parts.append(
+            _EXAM_CARD_TPL.format_map(
+                {
+                    "title": title,
+                    "grading_status": grading_status,
+                    "release_status": release_status,
+                    "finalized_badge": finalized_badge,
+                    "description": description,
+                    "exam_date": exam_date,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "duration": duration,
+                    "e_id": e_id,
+                    "e_id_q": e_id_q,
+                    "grading_display": grading_display,
+                    "release_display": release_display,
+                    "grade_button_html": grade_button_html,
+                }
+            )
+        )
+
+
+    return card_parts
+
+
+def get_admin_exam_list():
+    """
+    GET handler for admin exam list with result release date management
+    Shows grading deadline status and result release status
+    """
+    exam_list_html = "".join(_exam_list_fragments())
     html_str = render("admin_exam_list.html", {"exam_list_html": exam_list_html})
     return html_str, 200
 
 
+def get_admin_exam_list_stream(if_none_match: Optional[str] = None):
+    """
+    Streaming variant of get_admin_exam_list with ETag revalidation.
+
+    Returns (fragments, status, etag). A request whose If-None-Match
+    still names the current list version gets ([], 304) and skips the
+    whole card render; otherwise the page comes back as fragments —
+    shell, then one chunk per exam card — for _send_html to write
+    sequentially, so the full page is never concatenated in memory.
+    """
+    # Weak validator: within the cache TTL the version is authoritative;
+    # after a write every save path bumps it, so matches are safe to 304
+    etag = _exam_list_etag()
+    if if_none_match and if_none_match == etag:
+        return [], 304, etag
+
+    fragments = _exam_list_fragments()
+    # The fetch may have advanced the version; tag the response with the
+    # value that matches what was just rendered
+    return (
+        render_stream("admin_exam_list.html", {}, "exam_list_html", fragments),
+        200,
+        _exam_list_etag(),
+    )
+
+
 def get_set_result_release(exam_id: str):
     """
     GET handler for setting result release date
@@ -246,7 +508,7 @@ def get_set_result_release(exam_id: str):
                 "end_time": "",
                 "release_date": "",
                 "release_time": "00:00",
-                "errors_html": '<div class="alert alert-danger mb-3"><strong>Error:</strong> Exam ID is missing.</div>',
+                "errors_html": _ERR_MISSING_ID_HTML,
                 "success_html": "",
             },
         )
@@ -266,7 +528,9 @@ def get_set_result_release(exam_id: str):
                 "end_time": "",
                 "release_date": "",
                 "release_time": "00:00",
-                "errors_html": f'<div class="alert alert-danger">Exam "{exam_id}" not found.</div>',
+                "errors_html": _ERR_NOT_FOUND_TPL.format_map(
+                    {"exam_id": html.escape(exam_id)}
+                ),
                 "success_html": "",
             },
         )
@@ -289,6 +553,27 @@ def get_set_result_release(exam_id: str):
     return html_str, 200
 
 
+def _release_ctx(form: dict, exam=None, errors_html: str = "", success_html: str = ""):
+    """
+    Build the set_result_release.html context from form + exam data.
+
+    Mutates and returns `form`: _parse_form hands each request a fresh
+    dict that nothing else holds, so overlaying the display keys in place
+    skips a full copy per branch.
+    """
+    exam = exam or {}
+    form.update(
+        title=exam.get("title", ""),
+        description=exam.get("description", ""),
+        exam_date=exam.get("exam_date", ""),
+        start_time=exam.get("start_time", ""),
+        end_time=exam.get("end_time", ""),
+        errors_html=errors_html,
+        success_html=success_html,
+    )
+    return form
+
+
 def post_set_result_release(body: str):
     """
     POST handler for setting result release date
@@ -298,32 +583,19 @@ def post_set_result_release(body: str):
     exam_id = form.get("exam_id")
 
     if not exam_id:
-        ctx = dict(form)
-        ctx["errors_html"] = (
-            '<div class="alert alert-danger mb-3"><strong>Error:</strong> Exam ID is missing.</div>'
-        )
-        ctx["success_html"] = ""
-        ctx["title"] = ""
-        ctx["description"] = ""
-        ctx["exam_date"] = ""
-        ctx["start_time"] = ""
-        ctx["end_time"] = ""
+        ctx = _release_ctx(form, errors_html=_ERR_MISSING_ID_HTML)
         html_str = render("set_result_release.html", ctx)
         return html_str, 400
 
     # Get exam to validate
     exam = get_exam_by_id(exam_id)
     if not exam:
-        ctx = dict(form)
-        ctx["errors_html"] = (
-            f'<div class="alert alert-danger mb-3"><strong>Error:</strong> Exam "{exam_id}" not found.</div>'
+        ctx = _release_ctx(
+            form,
+            errors_html=_ERR_NOT_FOUND_STRONG_TPL.format_map(
+                {"exam_id": html.escape(exam_id)}
+            ),
         )
-        ctx["success_html"] = ""
-        ctx["title"] = ""
-        ctx["description"] = ""
-        ctx["exam_date"] = ""
-        ctx["start_time"] = ""
-        ctx["end_time"] = ""
         html_str = render("set_result_release.html", ctx)
         return html_str, 404
 
@@ -331,21 +603,14 @@ def post_set_result_release(body: str):
     errors = validate_result_release_date(form["release_date"], exam.get("exam_date"))
 
     if errors:
-        error_items = "".join(f"<li>{html.escape(e)}</li>" for e in errors)
+        error_items = _escaped_list_items(errors)
         errors_html = f"""
         <div class="alert alert-danger mb-3">
             <strong>Please fix the following:</strong>
             <ul class="mb-0">{error_items}</ul>
         </div>
         """
-        ctx = dict(form)
-        ctx["errors_html"] = errors_html
-        ctx["success_html"] = ""
-        ctx["title"] = exam.get("title", "")
-        ctx["exam_date"] = exam.get("exam_date", "")
-        ctx["description"] = exam.get("description", "")
-        ctx["start_time"] = exam.get("start_time", "")
-        ctx["end_time"] = exam.get("end_time", "")
+        ctx = _release_ctx(form, exam, errors_html=errors_html)
         html_str = render("set_result_release.html", ctx)
         return html_str, 400
 
@@ -357,20 +622,12 @@ def post_set_result_release(body: str):
             release_time=form["release_time"],
         )
 
-        success_html = """
-        <div class="alert alert-success mb-3">
-            <strong>Success!</strong> Result release date has been set.
-            <a href="/admin/exam-list" class="alert-link">Return to exam list</a>
-        </div>
-        """
-        ctx = dict(form)
-        ctx["success_html"] = success_html
-        ctx["errors_html"] = ""
-        ctx["title"] = exam.get("title", "")
-        ctx["exam_date"] = exam.get("exam_date", "")
-        ctx["description"] = exam.get("description", "")
-        ctx["start_time"] = exam.get("start_time", "")
-        ctx["end_time"] = exam.get("end_time", "")
+        # Release fields changed; drop the cached copies so the next GET
+        # (including the grading-settings form) refetches
+        _EXAM_CACHE.pop(exam_id, None)
+        _invalidate_exam_list_cache()
+
+        ctx = _release_ctx(form, exam, success_html=_RELEASE_SAVED_HTML)
         html_str = render("set_result_release.html", ctx)
         return html_str, 200
 
@@ -380,14 +637,7 @@ def post_set_result_release(body: str):
             <strong>Error:</strong> {html.escape(str(e))}
         </div>
         """
-        ctx = dict(form)
-        ctx["errors_html"] = errors_html
-        ctx["success_html"] = ""
-        ctx["title"] = exam.get("title", "")
-        ctx["exam_date"] = exam.get("exam_date", "")
-        ctx["description"] = exam.get("description", "")
-        ctx["start_time"] = exam.get("start_time", "")
-        ctx["end_time"] = exam.get("end_time", "")
+        ctx = _release_ctx(form, exam, errors_html=errors_html)
         html_str = render("set_result_release.html", ctx)
         return html_str, 500
 
@@ -396,6 +646,41 @@ def post_set_result_release(body: str):
 # NEW: COMPREHENSIVE GRADING SETTINGS
 # ============================================================
 
+# Admins typically load the settings page and POST it within seconds, which
+# would otherwise cost one Firestore document read per request. Cache the
+# exam doc briefly and invalidate whenever settings are saved.
+_EXAM_CACHE: dict = {}
+_EXAM_CACHE_TTL = 30  # seconds
+
+
+def _get_exam_cached(exam_id: str):
+    """Fetch an exam via get_exam_by_id with a short per-process TTL cache"""
+    now = time.monotonic()
+    entry = _EXAM_CACHE.get(exam_id)
+    if entry is not None and now - entry[0] < _EXAM_CACHE_TTL:
+        return entry[1]
+
+    exam = get_exam_by_id(exam_id)
+    if exam is not None:
+        _EXAM_CACHE[exam_id] = (now, exam)
+    return exam
+
+
+# Default grading-settings context; error branches overlay only the keys
+# that differ instead of rebuilding all ten per request
+_GRADING_DEFAULT_CTX = {
+    "exam_id": "",
+    "title": "Error",
+    "exam_date": "",
+    "exam_end_time": "",
+    "grading_deadline_date": "",
+    "grading_deadline_time": "23:59",
+    "release_date": "",
+    "release_time": "00:00",
+    "errors_html": "",
+    "success_html": "",
+}
+
 
 def get_grading_settings(exam_id: str):
     """
@@ -403,34 +688,19 @@ def get_grading_settings(exam_id: str):
     Combines grading deadline and result release in one interface
     """
     if not exam_id:
-        error_ctx = {
-            "exam_id": "",
-            "title": "Error",
-            "exam_date": "",
-            "exam_end_time": "",
-            "grading_deadline_date": "",
-            "grading_deadline_time": "23:59",
-            "release_date": "",
-            "release_time": "00:00",
-            "errors_html": '<div class="alert alert-danger">Missing exam ID</div>',
-            "success_html": "",
-        }
+        error_ctx = {**_GRADING_DEFAULT_CTX, "errors_html": _ERR_MISSING_ID_SHORT_HTML}
         html_str = render("admin_grading_setting.html", error_ctx)
         return html_str, 400
 
-    exam = get_exam_by_id(exam_id)
+    exam = _get_exam_cached(exam_id)
     if not exam:
         error_ctx = {
+            **_GRADING_DEFAULT_CTX,
             "exam_id": exam_id,
             "title": "Exam Not Found",
-            "exam_date": "",
-            "exam_end_time": "",
-            "grading_deadline_date": "",
-            "grading_deadline_time": "23:59",
-            "release_date": "",
-            "release_time": "00:00",
-            "errors_html": f'<div class="alert alert-danger">Exam "{html.escape(exam_id)}" not found.</div>',
-            "success_html": "",
+            "errors_html": _ERR_NOT_FOUND_TPL.format_map(
+                {"exam_id": html.escape(exam_id)}
+            ),
         }
         html_str = render("admin_grading_setting.html", error_ctx)
         return html_str, 404
@@ -454,6 +724,24 @@ def get_grading_settings(exam_id: str):
     return html_str, 200
 
 
+def _grading_ctx(form: dict, exam=None, errors_html: str = "", success_html: str = ""):
+    """
+    Build the admin_grading_setting.html context from form + exam data.
+
+    Mutates and returns `form` (fresh per request, see _release_ctx)
+    rather than allocating a copy.
+    """
+    exam = exam or {}
+    form.update(
+        title=exam.get("title", ""),
+        exam_date=exam.get("exam_date", ""),
+        exam_end_time=exam.get("end_time", ""),
+        errors_html=errors_html,
+        success_html=success_html,
+    )
+    return form
+
+
 def post_grading_settings(body: str):
     """
     POST handler to save grading deadline and result release settings
@@ -464,54 +752,56 @@ def post_grading_settings(body: str):
     exam_id = form.get("exam_id")
 
     if not exam_id:
-        error_ctx = dict(form)
-        error_ctx["errors_html"] = (
-            '<div class="alert alert-danger mb-3"><strong>Error:</strong> Exam ID is missing.</div>'
-        )
-        error_ctx["success_html"] = ""
-        error_ctx["title"] = ""
-        error_ctx["exam_date"] = ""
-        error_ctx["exam_end_time"] = ""
+        error_ctx = _grading_ctx(form, errors_html=_ERR_MISSING_ID_HTML)
         html_str = render("admin_grading_setting.html", error_ctx)
         return html_str, 400
 
-    exam = get_exam_by_id(exam_id)
+    exam = _get_exam_cached(exam_id)
     if not exam:
-        error_ctx = dict(form)
-        error_ctx["errors_html"] = (
-            f'<div class="alert alert-danger mb-3"><strong>Error:</strong> Exam "{html.escape(exam_id)}" not found.</div>'
+        error_ctx = _grading_ctx(
+            form,
+            errors_html=_ERR_NOT_FOUND_STRONG_TPL.format_map(
+                {"exam_id": html.escape(exam_id)}
+            ),
         )
-        error_ctx["success_html"] = ""
-        error_ctx["title"] = ""
-        error_ctx["exam_date"] = ""
-        error_ctx["exam_end_time"] = ""
         html_str = render("admin_grading_setting.html", error_ctx)
         return html_str, 404
 
     # VALIDATION
-    errors = validate_grading_periods(
-        exam_date=exam.get("exam_date"),
-        exam_end_time=exam.get("end_time"),
-        grading_deadline_date=form["grading_deadline_date"],
-        grading_deadline_time=form["grading_deadline_time"],
-        release_date=form["release_date"],
-        release_time=form["release_time"],
-    )
+    if (
+        not form["grading_deadline_date"]
+        and not form["release_date"]
+        and exam.get("exam_date")
+        and exam.get("end_time")
+    ):
+        # Fast path for the common cleared-form submit: both dates are
+        # missing, so report the required fields without entering the
+        # validator's datetime parsing
+        errors = required_grading_field_errors(
+            form["grading_deadline_date"],
+            form["grading_deadline_time"],
+            form["release_date"],
+            form["release_time"],
+        )
+    else:
+        errors = validate_grading_periods(
+            exam_date=exam.get("exam_date"),
+            exam_end_time=exam.get("end_time"),
+            grading_deadline_date=form["grading_deadline_date"],
+            grading_deadline_time=form["grading_deadline_time"],
+            release_date=form["release_date"],
+            release_time=form["release_time"],
+        )
 
     if errors:
-        error_items = "".join(f"<li>{html.escape(e)}</li>" for e in errors)
+        error_items = _escaped_list_items(errors)
         errors_html = f"""
         <div class="alert alert-danger mb-3">
             <strong> Please fix the following:</strong>
             <ul class="mb-0 mt-2">{error_items}</ul>
         </div>
         """
-        ctx = dict(form)
-        ctx["errors_html"] = errors_html
-        ctx["success_html"] = ""
-        ctx["title"] = exam.get("title", "")
-        ctx["exam_date"] = exam.get("exam_date", "")
-        ctx["exam_end_time"] = exam.get("end_time", "")
+        ctx = _grading_ctx(form, exam, errors_html=errors_html)
         html_str = render("admin_grading_setting.html", ctx)
         return html_str, 400
 
@@ -525,22 +815,11 @@ def post_grading_settings(body: str):
             release_time=form["release_time"],
         )
 
-        success_html = """
-        <div class="alert alert-success mb-3">
-            <h5 class="alert-heading"> Settings Saved Successfully!</h5>
-            <hr>
-            <p class="mb-0">
-                Grading deadline and result release dates have been configured.
-                <a href="/admin/exam-list" class="alert-link fw-bold">Return to exam list</a>
-            </p>
-        </div>
-        """
-        ctx = dict(form)
-        ctx["success_html"] = success_html
-        ctx["errors_html"] = ""
-        ctx["title"] = exam.get("title", "")
-        ctx["exam_date"] = exam.get("exam_date", "")
-        ctx["exam_end_time"] = exam.get("end_time", "")
+        # Settings changed; drop the cached copies so the next GET refetches
+        _EXAM_CACHE.pop(exam_id, None)
+        _invalidate_exam_list_cache()
+
+        ctx = _grading_ctx(form, exam, success_html=_SETTINGS_SAVED_HTML)
         html_str = render("admin_grading_setting.html", ctx)
         return html_str, 200
 
@@ -551,16 +830,75 @@ def post_grading_settings(body: str):
             {html.escape(str(e))}
         </div>
         """
-        ctx = dict(form)
-        ctx["errors_html"] = errors_html
-        ctx["success_html"] = ""
-        ctx["title"] = exam.get("title", "")
-        ctx["exam_date"] = exam.get("exam_date", "")
-        ctx["exam_end_time"] = exam.get("end_time", "")
+        ctx = _grading_ctx(form, exam, errors_html=errors_html)
         html_str = render("admin_grading_setting.html", ctx)
         return html_str, 500
 
 
+# Page size for cursor-paginated submission fetches
+_SUBMISSION_BATCH_SIZE = 500
+
+
+def get_all_and_ungraded_submissions(exam_id: str) -> tuple[list, list]:
+    """
+    Get all submissions for an exam plus the subset still needing grading.
+
+    Streams the submissions collection once and classifies locally, so
+    callers that need both lists pay for a single Firestore query instead
+    of two. Documents are fetched in cursor-paginated batches so large
+    cohorts don't force one huge response into memory at once.
+
+    Args:
+        exam_id: Exam identifier
+
+    Returns:
+        Tuple of (all submissions, ungraded submissions)
+    """
+    base_query = (
+        db.collection("submissions")
+        .where("exam_id", "==", exam_id)
+        .order_by("__name__")
+        .limit(_SUBMISSION_BATCH_SIZE)
+    )
+
+    submissions = []
+    ungraded = []
+    last_doc = None
+    while True:
+        query = base_query if last_doc is None else base_query.start_after(last_doc)
+
+        batch_count = 0
+        for doc in query.stream():
+            batch_count += 1
+            last_doc = doc
+
+            sub = doc.to_dict()
+            sub["submission_id"] = doc.id
+            submissions.append(sub)
+
+            # Check if fully graded
+            if not sub.get("mcq_graded") or not sub.get("sa_graded"):
+                ungraded.append(sub)
+
+        # A short batch means the previous page was the last one
+        if batch_count < _SUBMISSION_BATCH_SIZE:
+            break
+
+    return submissions, ungraded
+
+
+# Fields needed to classify and display an ungraded submission; projecting
+# with select() keeps Firestore from shipping the full answer payloads
+_UNGRADED_FIELDS = [
+    "exam_id",
+    "student_id",
+    "student_name",
+    "mcq_graded",
+    "sa_graded",
+    "submitted_at",
+]
+
+
 def get_ungraded_submissions(exam_id: str) -> list:
     """
     Get all submissions that still need grading
@@ -571,35 +909,38 @@ def get_ungraded_submissions(exam_id: str) -> list:
     Returns:
         List of ungraded submission dictionaries
     """
-    submissions_query = (
-        db.collection("submissions").where("exam_id", "==", exam_id).stream()
+    # Classify in Python on the same mcq_graded/sa_graded definition the
+    # other admin views use. A server-side fully_graded equality filter
+    # was tried here, but Firestore drops documents that lack the field,
+    # which silently hides every submission created before the flag was
+    # denormalized; the select() projection keeps the transfer small.
+    query = (
+        db.collection("submissions")
+        .where("exam_id", "==", exam_id)
+        .select(_UNGRADED_FIELDS)
+        .stream()
     )
 
     ungraded = []
-    for doc in submissions_query:
+    for doc in query:
         sub = doc.to_dict()
+        if sub.get("mcq_graded") and sub.get("sa_graded"):
+            continue
         sub["submission_id"] = doc.id
-
-        # Check if fully graded
-        if not sub.get("mcq_graded") or not sub.get("sa_graded"):
-            ungraded.append(sub)
+        ungraded.append(sub)
 
     return ungraded
 
 
 def get_all_exam_submissions(exam_id: str) -> list:
-    """Get all submissions for an exam"""
-    submissions_query = (
-        db.collection("submissions").where("exam_id", "==", exam_id).stream()
-    )
-
-    submissions = []
-    for doc in submissions_query:
-        sub = doc.to_dict()
-        sub["submission_id"] = doc.id
-        submissions.append(sub)
+    """
+    Get all submissions for an exam.
 
-    return submissions
+    Callers that also need the ungraded subset should use
+    get_all_and_ungraded_submissions directly so the collection is only
+    streamed once per request.
+    """
+    return get_all_and_ungraded_submissions(exam_id)[0]
 
 
 # ============================================================
@@ -607,17 +948,23 @@ def get_all_exam_submissions(exam_id: str) -> list:
 # ============================================================
 
 
+# Like the login page, the empty import form renders from a constant
+# context; cache the finished page after the first request
+_IMPORT_PAGE_CACHE: list = []
+
+
 def get_account_import_page():
     """
     GET handler for the account import page
     """
-    ctx = {
-        "success_html": "",
-        "errors_html": "",
-        "max_file_size": "2MB",  # Display limit
-    }
-    html_str = render("admin_account_import.html", ctx)
-    return html_str, 200
+    if not _IMPORT_PAGE_CACHE:
+        ctx = {
+            "success_html": "",
+            "errors_html": "",
+            "max_file_size": "2MB",  # Display limit
+        }
+        _IMPORT_PAGE_CACHE.append(render("admin_account_import.html", ctx))
+    return _IMPORT_PAGE_CACHE[0], 200
 
 
 def post_import_accounts(
@@ -644,24 +991,12 @@ def post_import_accounts(
 
     # 1. Validation Check: Was a file actually provided?
     if not file_name or file_name.strip() == "":
-        ctx[
-            "errors_html"
-        ] = """
-        <div class="alert alert-danger">
-            <strong>Upload Failed:</strong> Please select an Excel file for import.
-        </div>
-        """
+        ctx["errors_html"] = _IMPORT_NO_FILE_HTML
         html_str = render("admin_account_import.html", ctx)
         return html_str, 400
 
     if not file_content:
-        ctx[
-            "errors_html"
-        ] = """
-        <div class="alert alert-danger">
-            <strong>Upload Failed:</strong> File content was empty or unreadable by the server.
-        </div>
-        """
+        ctx["errors_html"] = _IMPORT_EMPTY_FILE_HTML
         html_str = render("admin_account_import.html", ctx)
         return html_str, 400
 
@@ -674,6 +1009,7 @@ def post_import_accounts(
 
         # 3. Bulk create users in Firebase Auth & Firestore
         stats = bulk_create_users(users_list, user_type)
+        bump_user_list_version(user_type)
 
         # 4. Success / Report
 
@@ -689,9 +1025,7 @@ def post_import_accounts(
             )
 
             # Detailed error list
-            error_list_html = "".join(
-                f"<li>{html.escape(e)}</li>" for e in stats["errors"]
-            )
+            error_list_html = _escaped_list_items(stats["errors"])
             error_section = f"""
             <h6 class="mt-3">Detailed Errors:</h6>
             <ul class="mb-0 small text-danger">
@@ -736,30 +1070,46 @@ def post_import_accounts(
 
 
 # ------- Deactivate student / lecturer account ---------
+# Constant JSON error payloads for the deactivate handlers, serialized
+# once at import instead of on every request. orjson would shave a little
+# more off the dynamic dumps calls, but it isn't a project dependency and
+# the fixed payloads dominate the error paths.
+_ERR_NO_STUDENT_ID_JSON = json.dumps(
+    {"success": False, "message": "Student ID is required"}
+)
+_ERR_NO_LECTURER_ID_JSON = json.dumps(
+    {"success": False, "message": "Lecturer ID is required"}
+)
+_ERR_SERVER_JSON = json.dumps({"success": False, "message": "Server Error"})
+
+# One CollectionReference shared by the deactivate handlers instead of a
+# fresh allocation per request. The list handlers keep calling
+# db.collection() per request so their tests can patch the query chain.
+_USERS_REF = db.collection("users")
+
+
 def deactivate_student_handler(request_body_json):
     try:
         student_id = request_body_json.get("student_id")
 
         if not student_id:
-            return (
-                json.dumps({"success": False, "message": "Student ID is required"}),
-                400,
+            return _ERR_NO_STUDENT_ID_JSON, 400
+
+        # bulk_create_users keys user docs by their student/lecturer ID, so
+        # the update goes straight to the document; Firestore raises
+        # NotFound for a missing doc, which replaces the existence read
+        try:
+            _USERS_REF.document(student_id).update(
+                {"is_active": False, "status": "inactive"}
             )
-
-        users_ref = db.collection("users")
-        query = users_ref.where("student_id", "==", student_id).limit(1)
-        docs = list(query.stream())
-
-        if not docs:
+        except NotFound:
             return (
                 json.dumps(
                     {"success": False, "message": f"Student {student_id} not found"}
                 ),
                 404,
             )
-
-        doc_ref = docs[0].reference
-        doc_ref.update({"is_active": False, "status": "inactive"})
+        bump_user_list_version("student")
 
         return (
             json.dumps(
@@ -773,7 +1123,7 @@ def deactivate_student_handler(request_body_json):
 
     except Exception as e:
         print(f"Error deactivating student: {e}")
-        return json.dumps({"success": False, "message": "Server Error"}), 500
+        return _ERR_SERVER_JSON, 500
 
 
 def deactivate_lecturer_handler(request_body_json):
@@ -781,25 +1131,21 @@ def deactivate_lecturer_handler(request_body_json):
         lecturer_id = request_body_json.get("lecturer_id")
 
         if not lecturer_id:
-            return (
-                json.dumps({"success": False, "message": "Lecturer ID is required"}),
-                400,
-            )
+            return _ERR_NO_LECTURER_ID_JSON, 400
 
-        users_ref = db.collection("users")
-        query = users_ref.where("lecturer_id", "==", lecturer_id).limit(1)
-        docs = list(query.stream())
-
-        if not docs:
+        # Same read-free update as deactivate_student_handler
+        try:
+            _USERS_REF.document(lecturer_id).update(
+                {"is_active": False, "status": "inactive"}
+            )
+        except NotFound:
             return (
                 json.dumps(
                     {"success": False, "message": f"Lecturer {lecturer_id} not found"}
                 ),
                 404,
             )
-
-        doc_ref = docs[0].reference
-        doc_ref.update({"is_active": False, "status": "inactive"})
+        bump_user_list_version("lecturer")
 
         return (
             json.dumps(
@@ -813,179 +1159,340 @@ def deactivate_lecturer_handler(request_body_json):
 
     except Exception as e:
         print(f"Error deactivating lecturer: {e}")
-        return json.dumps({"success": False, "message": "Server Error"}), 500
+        return _ERR_SERVER_JSON, 500
 
 
-def get_admin_student_list():
+def deactivate_bulk_handler(request_body_json):
     """
-    GET handler for the Admin Student List page.
-    Fetches all users with role='student' from Firestore with Active/Inactive status.
-    FIX: Separated Name and Email into distinct columns to match table headers.
+    POST handler deactivating many users in one request.
+
+    Expects {"user_ids": [...]}; writes go through WriteBatch commits in
+    chunks of 500 (the Firestore batch limit), so a bulk deactivate costs
+    one RPC per 500 users instead of one per user.
     """
     try:
-        # Fetch all students
-        students_ref = db.collection("users").where("role", "==", "student").stream()
+        user_ids = request_body_json.get("user_ids") or []
+        if not user_ids:
+            return (
+                json.dumps({"success": False, "message": "No user IDs provided"}),
+                400,
+            )
 
-        students = []
-        for doc in students_ref:
-            s = doc.to_dict()
-            is_active = s.get("is_active", True)
+        batch = db.batch()
+        ops_in_batch = 0
+        for user_id in user_ids:
+            batch.update(
+                _USERS_REF.document(str(user_id)),
+                {"is_active": False, "status": "inactive"},
+            )
+            ops_in_batch += 1
+            if ops_in_batch >= 500:
+                batch.commit()
+                batch = db.batch()
+                ops_in_batch = 0
+        if ops_in_batch:
+            batch.commit()
+
+        bump_user_list_version("student")
+        bump_user_list_version("lecturer")
 
-            students.append(
+        return (
+            json.dumps(
                 {
-                    "student_id": s.get("student_id", "N/A"),
-                    "name": s.get("name", "N/A"),
-                    "email": s.get("email", "N/A"),
-                    "major": s.get("major", "N/A"),
-                    "year": s.get("year", "-"),
-                    "semester": s.get("semester", "-"),
-                    "ic": s.get("ic", "N/A"),
-                    "is_active": is_active,
+                    "success": True,
+                    "message": f"{len(user_ids)} users have been deactivated.",
                 }
-            )
+            ),
+            200,
+        )
+
+    except Exception as e:
+        print(f"Error bulk-deactivating users: {e}")
+        return _ERR_SERVER_JSON, 500
+
+
+# Only the fields each admin table renders; used as Firestore projections
+_STUDENT_LIST_FIELDS = [
+    "student_id",
+    "name",
+    "email",
+    "major",
+    "year",
+    "semester",
+    "ic",
+    "is_active",
+]
+_LECTURER_LIST_FIELDS = ["lecturer_id", "name", "email", "faculty", "ic", "is_active"]
+
+
+# Same single-pass escaper the template engine uses: one C-level
+# str.translate sweep per value instead of html.escape's five chained
+# .replace scans, which matters inside the per-row loops below
+_ESC_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+    }
+)
+
+
+def _esc(value) -> str:
+    return str(value).translate(_ESC_TABLE)
+
+
+# Per-process version counters backing weak ETags for the admin user
+# lists, mirroring the exam-list scheme: every write path that changes a
+# roster bumps its counter, so a matching If-None-Match can skip the
+# Firestore stream and row render entirely.
+_USER_LIST_VERSIONS = {"student": 0, "lecturer": 0}
+_USER_LIST_LOCK = threading.Lock()
+
+
+def bump_user_list_version(role: str) -> None:
+    """Invalidate cached admin list ETags after a user write"""
+    with _USER_LIST_LOCK:
+        if role in _USER_LIST_VERSIONS:
+            _USER_LIST_VERSIONS[role] += 1
+
+
+def _user_list_etag(role: str) -> str:
+    with _USER_LIST_LOCK:
+        return 'W/"{}-list-{}-{}"'.format(role, _ETAG_NONCE, _USER_LIST_VERSIONS[role])
 
-        # Sort by Student ID
-        students.sort(key=lambda x: x["student_id"])
 
-        rows_html = ""
-        if not students:
-            rows_html = '<tr><td colspan="6" class="text-center text-muted">No students found. Import accounts to get started.</td></tr>'
+def _student_list_fragments():
+    """
+    Fetch students and build one HTML chunk per table row.
+
+    Returns (fragments, total_count); an empty result yields a single
+    empty-state row. Callers join the fragments for a plain render or
+    stream them out one at a time.
+    """
+    # Fetch all students, ordered server-side — Firestore sorts on the
+    # (role, student_id) composite index for free, so no Python sort.
+    # The projection skips fields the table never shows (uid, role,
+    # timestamps), trimming each document on the wire.
+    students_ref = (
+        db.collection("users")
+        .where("role", "==", "student")
+        .select(_STUDENT_LIST_FIELDS)
+        .order_by("student_id")
+        .stream()
+    )
+
+    # Build rows directly off the document stream: one pass, no
+    # intermediate per-student dicts, and the row loop naturally yields
+    # to the network between Firestore result pages
+    row_parts = []
+    for doc in students_ref:
+        data = doc.to_dict()
+        s = {
+            "student_id": data.get("student_id", "N/A"),
+            "name": data.get("name", "N/A"),
+            "email": data.get("email", "N/A"),
+            "major": data.get("major", "N/A"),
+            "year": data.get("year", "-"),
+            "semester": data.get("semester", "-"),
+        }
+
+        # Check if Active (default to True)
+        is_active = data.get("is_active", True)
+        if is_active:
+            row_class = ""
+            status_badge = _ACTIVE_BADGE
+            btn_text, btn_class = _BTN_DEACTIVATE
+            btn_action = f"toggleRowStatus('{s['student_id']}', 'deactivate')"
         else:
-            for s in students:
-
-                # Check if Active (default to True)
-                is_active = s.get("is_active", True)
-                if is_active:
-                    row_class = ""
-                    status_badge = '<span class="badge bg-success ms-2">Active</span>'
-                    btn_text = "Deactivate"
-                    btn_class = "btn-outline-danger"
-                    btn_action = f"toggleRowStatus('{s['student_id']}', 'deactivate')"
-                else:
-                    row_class = "table-secondary text-muted"
-                    status_badge = (
-                        '<span class="badge bg-secondary ms-2">Inactive</span>'
-                    )
-                    btn_text = "Reactivate"
-                    btn_class = "btn-success"
-                    btn_action = f"toggleRowStatus('{s['student_id']}', 'reactivate')"
-
-                rows_html += f"""
-                <tr id="student-row-{s['student_id']}" class="{row_class}">
-                    <td>
-                        <span class="fw-bold">{html.escape(str(s['student_id']))}</span>
-                        {status_badge}
-                    </td>
-                    <td>{html.escape(str(s['name']))}</td>
-                    <td>{html.escape(str(s['email']))}</td>
-                    <td>{html.escape(str(s['major']))}</td>
-                    <td>Y{s['year']} S{s['semester']}</td>
-                    <td>
-                        <a href="/profile?user_id={s['student_id']}" class="btn btn-sm btn-outline-primary me-1">View</a>
-                        <button class="btn btn-sm {btn_class}" onclick="{btn_action}">{btn_text}</button>
-                    </td>
-                </tr>
-                """
+            row_class = _ROW_INACTIVE_CLASS
+            status_badge = _INACTIVE_BADGE
+            btn_text, btn_class = _BTN_REACTIVATE
+            btn_action = f"toggleRowStatus('{s['student_id']}', 'reactivate')"
+
+        row_parts.append(f"""
+            <tr id="student-row-{s['student_id']}" class="{row_class}">
+                <td>
+                    <span class="fw-bold">{_esc(s['student_id'])}</span>
+                    {status_badge}
+                </td>
+                <td>{_esc(s['name'])}</td>
+                <td>{_esc(s['email'])}</td>
+                <td>{_esc(s['major'])}</td>
+                <td>Y{s['year']} S{s['semester']}</td>
+                <td>
+                    <a href="/profile?user_id={s['student_id']}" class="btn btn-sm btn-outline-primary me-1">View</a>
+                    <button class="btn btn-sm {btn_class}" onclick="{btn_action}">{btn_text}</button>
+                </td>
+            </tr>
+            """)
+
+    if row_parts:
+        return row_parts, len(row_parts)
+
+    return ['<tr><td colspan="6" class="text-center text-muted">No students found. Import accounts to get started.</td></tr>'], 0
+
+
+def _student_list_error_page(exc: Exception) -> str:
+    return _LIST_ERROR_PAGE_TPL.format_map(
+        {
+            "heading": "Error Fetching Students",
+            "message": str(exc),
+            "back_href": "/admin/dashboard",
+        }
+    )
 
-        ctx = {"student_rows_html": rows_html, "total_count": len(students)}
-        return render("admin_student_list.html", ctx), 200
 
+def get_admin_student_list():
+    """
+    GET handler for the Admin Student List page.
+    Fetches all users with role='student' from Firestore with Active/Inactive status.
+    FIX: Separated Name and Email into distinct columns to match table headers.
+    """
+    try:
+        fragments, total = _student_list_fragments()
+        ctx = {"student_rows_html": "".join(fragments), "total_count": total}
+        return render("admin_student_list.html", ctx), 200
     except Exception as e:
-        error_html = f"""
-        <div class="container mt-5">
-            <div class="alert alert-danger">
-                <h4>Error Fetching Students</h4>
-                <p>{str(e)}</p>
-                <a href="/admin/dashboard" class="btn btn-secondary">Back</a>
-            </div>
-        </div>
-        """
-        return error_html, 500
+        return _student_list_error_page(e), 500
 
 
-def get_admin_lecturer_list():
+def get_admin_student_list_stream(if_none_match: Optional[str] = None):
     """
-    GET handler for the Admin Lecturer List page.
-    Fetches all users with role='lecturer' from Firestore.
+    Streaming variant of get_admin_student_list with ETag revalidation.
+
+    Returns (fragments, status, etag). A request whose If-None-Match
+    still names the current roster version gets ([], 304) with no
+    Firestore stream; otherwise the page comes back as shell plus one
+    chunk per table row for _send_html to write sequentially, so a large
+    roster never has to exist as one multi-MB string.
     """
+    etag = _user_list_etag("student")
+    if if_none_match and if_none_match == etag:
+        return [], 304, etag
+
     try:
-        # Fetch all lecturers
-        lecturers_ref = db.collection("users").where("role", "==", "lecturer").stream()
+        fragments, total = _student_list_fragments()
+        return (
+            render_stream(
+                "admin_student_list.html",
+                {"total_count": total},
+                "student_rows_html",
+                fragments,
+            ),
+            200,
+            etag,
+        )
+    except Exception as e:
+        return _student_list_error_page(e), 500, None
 
-        lecturers = []
-        for doc in lecturers_ref:
-            lecturer_data = doc.to_dict()
 
-            # Check active status
-            is_active = lecturer_data.get("is_active", True)
+def _lecturer_list_fragments():
+    """
+    Fetch lecturers and build one HTML chunk per table row.
 
-            lecturers.append(
-                {
-                    "lecturer_id": lecturer_data.get("lecturer_id", "N/A"),
-                    "name": lecturer_data.get("name", "N/A"),
-                    "email": lecturer_data.get("email", "N/A"),
-                    "faculty": lecturer_data.get("faculty", "N/A"),
-                    "ic": lecturer_data.get("ic", "N/A"),
-                    "is_active": is_active,
-                }
-            )
+    Same (fragments, total_count) contract as _student_list_fragments.
+    """
+    # Fetch all lecturers, projected and ordered server-side like the
+    # student list
+    lecturers_ref = (
+        db.collection("users")
+        .where("role", "==", "lecturer")
+        .select(_LECTURER_LIST_FIELDS)
+        .order_by("lecturer_id")
+        .stream()
+    )
 
-        # Sort by Lecturer ID
-        lecturers.sort(key=lambda x: x["lecturer_id"])
+    # Single pass over the document stream, same shape as the student rows
+    row_parts = []
+    for doc in lecturers_ref:
+        data = doc.to_dict()
+        lecturer = {
+            "lecturer_id": data.get("lecturer_id", "N/A"),
+            "name": data.get("name", "N/A"),
+            "email": data.get("email", "N/A"),
+            "faculty": data.get("faculty", "N/A"),
+        }
 
-        # Generate HTML rows
-        rows_html = ""
-        if not lecturers:
-            rows_html = '<tr><td colspan="6" class="text-center text-muted">No lecturers found. Import accounts to get started.</td></tr>'
+        # Check active status
+        is_active = data.get("is_active", True)
+        if is_active:
+            row_class = ""
+            status_badge = _ACTIVE_BADGE
+            btn_text, btn_class = _BTN_DEACTIVATE
+            btn_action = f"deactivateLecturer('{lecturer['lecturer_id']}')"
         else:
-            for lecturer in lecturers:
-
-                is_active = lecturer.get("is_active", True)
+            row_class = _ROW_INACTIVE_CLASS
+            status_badge = _INACTIVE_BADGE
+            btn_text, btn_class = _BTN_REACTIVATE
+            btn_action = f"reactivateLecturer('{lecturer['lecturer_id']}')"
+
+        row_parts.append(f"""
+            <tr id="lecturer-row-{lecturer['lecturer_id']}" class="{row_class}">
+                <td>
+                    <span class="fw-bold">{_esc(lecturer['lecturer_id'])}</span>
+                    {status_badge}
+                </td>
+                <td>{_esc(lecturer['name'])}</td>
+                <td>{_esc(lecturer['email'])}</td>
+                <td>{_esc(lecturer['faculty'])}</td>
+                <td>
+                    <a href="/profile?user_id={lecturer['lecturer_id']}" class="btn btn-sm btn-outline-primary me-1">View</a>
+                    <button class="btn btn-sm {btn_class}" onclick="{btn_action}">{btn_text}</button>
+                </td>
+            </tr>
+            """)
+
+    if row_parts:
+        return row_parts, len(row_parts)
+
+    return ['<tr><td colspan="6" class="text-center text-muted">No lecturers found. Import accounts to get started.</td></tr>'], 0
+
+
+def _lecturer_list_error_page(exc: Exception) -> str:
+    return _LIST_ERROR_PAGE_TPL.format_map(
+        {
+            "heading": "Error Fetching Lecturers",
+            "message": str(exc),
+            "back_href": "/admin/exam-list",
+        }
+    )
 
-                if is_active:
-                    row_class = ""
-                    status_badge = '<span class="badge bg-success ms-2">Active</span>'
 
-                    btn_text = "Deactivate"
-                    btn_class = "btn-outline-danger"
-                    btn_action = f"deactivateLecturer('{lecturer['lecturer_id']}')"
-                else:
-                    row_class = "table-secondary text-muted"
-                    status_badge = (
-                        '<span class="badge bg-secondary ms-2">Inactive</span>'
-                    )
+def get_admin_lecturer_list():
+    """
+    GET handler for the Admin Lecturer List page.
+    Fetches all users with role='lecturer' from Firestore.
+    """
+    try:
+        fragments, total = _lecturer_list_fragments()
+        ctx = {"lecturer_rows_html": "".join(fragments), "total_count": total}
+        return render("admin_lecturer_list.html", ctx), 200
+    except Exception as e:
+        return _lecturer_list_error_page(e), 500
 
-                    btn_text = "Reactivate"
-                    btn_class = "btn-success"
-                    btn_action = f"reactivateLecturer('{lecturer['lecturer_id']}')"
-
-                rows_html += f"""
-                <tr id="lecturer-row-{lecturer['lecturer_id']}" class="{row_class}">
-                    <td>
-                        <span class="fw-bold">{html.escape(str(lecturer['lecturer_id']))}</span>
-                        {status_badge}
-                    </td>
-                    <td>{html.escape(str(lecturer['name']))}</td>
-                    <td>{html.escape(str(lecturer['email']))}</td>
-                    <td>{html.escape(str(lecturer['faculty']))}</td>
-                    <td>
-                        <a href="/profile?user_id={lecturer['lecturer_id']}" class="btn btn-sm btn-outline-primary me-1">View</a>
-                        <button class="btn btn-sm {btn_class}" onclick="{btn_action}">{btn_text}</button>
-                    </td>
-                </tr>
-                """
 
-        ctx = {"lecturer_rows_html": rows_html, "total_count": len(lecturers)}
-        return render("admin_lecturer_list.html", ctx), 200
+def get_admin_lecturer_list_stream(if_none_match: Optional[str] = None):
+    """
+    Streaming variant of get_admin_lecturer_list; same (fragments,
+    status, etag) contract as get_admin_student_list_stream.
+    """
+    etag = _user_list_etag("lecturer")
+    if if_none_match and if_none_match == etag:
+        return [], 304, etag
 
+    try:
+        fragments, total = _lecturer_list_fragments()
+        return (
+            render_stream(
+                "admin_lecturer_list.html",
+                {"total_count": total},
+                "lecturer_rows_html",
+                fragments,
+            ),
+            200,
+            etag,
+        )
     except Exception as e:
-        error_html = f"""
-        <div class="container mt-5">
-            <div class="alert alert-danger">
-                <h4>Error Fetching Lecturers</h4>
-                <p>{str(e)}</p>
-                <a href="/admin/exam-list" class="btn btn-secondary">Back</a>
-            </div>
-        </div>
-        """
-        return error_html, 500
+        return _lecturer_list_error_page(e), 500, None
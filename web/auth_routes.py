@@ -1,33 +1,40 @@
 # web/auth_routes.py
-from urllib.parse import parse_qs
+from urllib.parse import parse_qsl
 import html
 from services.auth_service import authenticate_user, get_redirect_url
 from .template_engine import render
 
 
+# The login page renders from a constant context, so the finished page
+# can be reused across requests once built
+_LOGIN_PAGE_CACHE: list = []
+
+
 def get_login_page():
     """
     GET handler for login page
     """
-    ctx = {
-        "errors_html": "",
-        "user_id": "",  # Changed from "email"
-    }
-    html_str = render("login.html", ctx)
-    return html_str, 200
+    if not _LOGIN_PAGE_CACHE:
+        ctx = {
+            "errors_html": "",
+            "user_id": "",  # Changed from "email"
+        }
+        _LOGIN_PAGE_CACHE.append(render("login.html", ctx))
+    return _LOGIN_PAGE_CACHE[0], 200
 
 
 def post_login(body: str):
     """
     POST handler for login authentication
     """
-    # Parse form data
-    data = parse_qs(body)
+    # Parse form data; the login form only carries single-valued fields,
+    # so parse_qsl skips parse_qs's per-key list wrapping
+    data = dict(parse_qsl(body, max_num_fields=32))
 
-    user_id = data.get("user_id", [""])[0].strip()
+    user_id = data.get("user_id", "").strip()
     # CHANGED: Get 'password' input instead of 'ic'
-    password = data.get("password", [""])[0].strip()
-    role = data.get("role", ["student"])[0].strip()
+    password = data.get("password", "").strip()
+    role = data.get("role", "student").strip()
 
     # Validation
     if not user_id or not password:
@@ -1,63 +1,232 @@
-from urllib.parse import parse_qs
-import html
+from urllib.parse import parse_qsl
+import functools
+import hashlib
 import json
+import secrets
+import time
 from core.validation import validate_exam, validate_exam_date, validate_exam_times
 from services.exam_service import (
     save_exam_draft,
     publish_exam,
     get_exam_by_id,
-    check_grading_locked,
+    evaluate_grading_lock,
+    exam_data_version,
     soft_delete_exam,
     delete_exam_and_contents,
     get_exams_by_lecturer,
     get_all_exams,
 )
-from services.question_service import has_mcq_for_exam, has_short_for_exam
+from services.question_service import get_question_flags
 from services.student_filter_service import (
     save_exam_filters,
     get_exam_filters,
     get_filter_summary,
+    get_available_filters,
 )
 from .template_engine import render
 
+# Single-pass escaper shared by the hot loops below; html.escape chains up
+# to five .replace scans per value, str.translate does one C-level sweep
+_ESC_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+    }
+)
 
-def _parse_form(body: str) -> dict:
-    data = parse_qs(body)
 
-    def get_field(key: str) -> str:
-        return data.get(key, [""])[0]
+def _esc(value) -> str:
+    return str(value).translate(_ESC_TABLE)
 
-    def get_multi(key: str) -> list:
-        return data.get(key, [])
 
-    return {
-        "exam_id": get_field("exam_id"),
-        "title": get_field("title"),
-        "description": get_field("description"),
-        "duration": get_field("duration"),
-        "exam_date": get_field("exam_date"),
-        "start_time": get_field("start_time"),
-        "end_time": get_field("end_time"),
-        "instructions": get_field("instructions"),
-        "filter_years": get_multi("filter_year"),
-        "filter_majors": get_multi("filter_major"),
-        "filter_semesters": get_multi("filter_semester"),
-        "lecturer_id": get_field("lecturer_id"),
+# Escape and lowercase fused into one translate pass; used for the
+# data-title attribute the exam list emits for client-side filtering
+_LOWER_ESC_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+        **{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)},
+    }
+)
+
+
+# Short per-process caches for the per-exam lookups behind the review and
+# published pages. The MCQ/short-answer existence bits and the exam doc
+# change rarely compared to how often those pages render, so a 30s TTL
+# saves a Firestore round-trip per lookup on the hot path.
+_QUESTION_FLAG_CACHE: dict = {}
+_EXAM_DOC_CACHE: dict = {}
+_LOOKUP_CACHE_TTL = 30  # seconds
+
+
+def _question_flags_cached(exam_id: str):
+    """Return (has_mcq, has_short) for an exam via a short TTL cache"""
+    now = time.monotonic()
+    entry = _QUESTION_FLAG_CACHE.get(exam_id)
+    if entry is not None and now - entry[0] < _LOOKUP_CACHE_TTL:
+        return entry[1]
+
+    flags = get_question_flags(exam_id)
+    _QUESTION_FLAG_CACHE[exam_id] = (now, flags)
+    return flags
+
+
+def _get_exam_cached(exam_id: str):
+    """Fetch an exam via get_exam_by_id with a short per-process TTL cache"""
+    now = time.monotonic()
+    entry = _EXAM_DOC_CACHE.get(exam_id)
+    if entry is not None and now - entry[0] < _LOOKUP_CACHE_TTL:
+        return entry[1]
+
+    exam = get_exam_by_id(exam_id)
+    if exam is not None:
+        _EXAM_DOC_CACHE[exam_id] = (now, exam)
+    return exam
+
+
+def invalidate_question_cache(exam_id: str) -> None:
+    """Drop cached per-exam lookups after a question or exam edit"""
+    _QUESTION_FLAG_CACHE.pop(exam_id, None)
+    _EXAM_DOC_CACHE.pop(exam_id, None)
+
+
+# Digests of forms that already passed validation in post_submit_exam.
+# Publishing re-posts the identical form right after a successful save, so
+# a digest match lets post_publish_exam skip re-running both validators.
+_VALIDATED_FORM_HASHES: set = set()
+_VALIDATED_FORM_HASHES_MAX = 1024
+
+
+def _validation_hash(form: dict) -> str:
+    # The current day is part of the digest: validate_exam_date compares
+    # against today, so a form validated yesterday must not skip
+    # validation after midnight
+    raw = "|".join(
+        (
+            time.strftime("%Y-%m-%d"),
+            form["title"],
+            form["description"],
+            form["duration"],
+            form["instructions"],
+            form["exam_date"],
+        )
+    )
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _mark_form_validated(form_hash: str) -> None:
+    if len(_VALIDATED_FORM_HASHES) >= _VALIDATED_FORM_HASHES_MAX:
+        _VALIDATED_FORM_HASHES.clear()
+    _VALIDATED_FORM_HASHES.add(form_hash)
+
+
+# (label, css class) for the review-page builder buttons, indexed by
+# whether the exam already has questions of that type
+_MCQ_BTN = {
+    True: ("View / Edit MCQ", "btn btn-primary"),
+    False: ("Build MCQ", "btn btn-outline-primary"),
+}
+_SHORT_BTN = {
+    True: ("View / Edit Short Answers", "btn btn-primary"),
+    False: ("Build Short Answers", "btn btn-outline-primary"),
+}
+
+
+# Static banner chrome for validation failures; only the <li> items vary
+_ERR_BANNER_SUBMIT_TPL = """
+        <div class="alert alert-danger mb-3">
+            <strong>Please fix the following:</strong>
+            <ul class="mb-0">{items}</ul>
+        </div>
+        """
+_ERR_BANNER_PUBLISH_TPL = """
+        <div class="alert alert-danger mb-3">
+            <strong>Unable to publish exam:</strong>
+            <ul class="mb-0">{items}</ul>
+        </div>
+        """
+
+
+def _error_items(errors: list) -> str:
+    """Escaped <li> items for a validation error list.
+
+    Validation usually fails one rule at a time, so the single-error case
+    skips the generator/join machinery.
+    """
+    if len(errors) == 1:
+        return f"<li>{_esc(errors[0])}</li>"
+    return "".join(f"<li>{_esc(e)}</li>" for e in errors)
+
+
+# Maps repeated checkbox field names to their list-valued form keys; frozen
+# at module scope so _parse_form does not rebuild it per request
+_MULTI_FIELDS = {
+    "filter_year": "filter_years",
+    "filter_major": "filter_majors",
+    "filter_semester": "filter_semesters",
+}
+
+
+def _parse_form(body: str) -> dict:
+    # Single pass over decoded pairs instead of parse_qs building a list
+    # for every key plus the [0] indexing to unwrap them again; only the
+    # filter fields are multi-valued
+    form = {
+        "exam_id": "",
+        "title": "",
+        "description": "",
+        "duration": "",
+        "exam_date": "",
+        "start_time": "",
+        "end_time": "",
+        "instructions": "",
+        "filter_years": [],
+        "filter_majors": [],
+        "filter_semesters": [],
+        "lecturer_id": "",
     }
+    for key, value in parse_qsl(body, max_num_fields=64):
+        target = _MULTI_FIELDS.get(key)
+        if target is not None:
+            form[target].append(value)
+        elif key in form:
+            form[key] = value
+    return form
 
 
 def _build_filter_context(filters: dict, available_majors: list = None) -> dict:
-    """Build context for filter checkboxes"""
-    years = filters.get("years", [])
-    majors = filters.get("majors", [])
-    semesters = filters.get("semesters", [])
+    """Build context for filter checkboxes.
+
+    Thin wrapper that normalizes the filter lists to tuples and delegates
+    to the memoized builder; the same filter shapes recur across list
+    renders and repeated edits, so most calls are a cache hit plus one
+    shallow copy.
+    """
+    cached = _filter_context_cached(
+        tuple(filters.get("years", ())),
+        tuple(filters.get("majors", ())),
+        tuple(filters.get("semesters", ())),
+        tuple(available_majors) if available_majors else None,
+    )
+    return dict(cached)
 
-    if not available_majors:
-        available_majors = [
+
+@functools.lru_cache(maxsize=128)
+def _filter_context_cached(
+    years: tuple, majors: tuple, semesters: tuple, available: tuple
+) -> dict:
+    if not available:
+        available = (
             "Computer Science",
             "Mechanical Engineering",
             "Business Administration",
-        ]
+        )
 
     context = {
         "year1_checked": "checked" if "1" in years else "",
@@ -66,10 +235,10 @@ def _build_filter_context(filters: dict, available_majors: list = None) -> dict:
         "year4_checked": "checked" if "4" in years else "",
         "sem1_checked": "checked" if "1" in semesters else "",
         "sem2_checked": "checked" if "2" in semesters else "",
-        "available_majors": available_majors,
+        "available_majors": list(available),
     }
 
-    for major in available_majors:
+    for major in available:
         safe_key = major.replace(" ", "_").lower()
         context[f"major_{safe_key}_checked"] = "checked" if major in majors else ""
         context[f"major_{safe_key}_name"] = major
@@ -80,35 +249,74 @@ def _build_filter_context(filters: dict, available_majors: list = None) -> dict:
 # ---------- GET handlers ----------
 
 
+@functools.lru_cache(maxsize=1024)
+def _compute_end_time(start_time, duration):
+    """Add duration minutes to an HH:MM start, wrapping past midnight.
+
+    Cached because the same (start_time, duration) pairs repeat across
+    every list render; returns None when either value is unparseable.
+    """
+    try:
+        # partition instead of split+map: no list or iterator allocation,
+        # and it still tolerates unpadded legacy values like "9:30"
+        hours, _, minutes = start_time.partition(":")
+        total_minutes = int(hours) * 60 + int(minutes) + int(duration)
+    except (ValueError, AttributeError, TypeError):
+        return None
+    return f"{(total_minutes // 60) % 24:02d}:{total_minutes % 60:02d}"
+
+
+def _exam_times(exam: dict, default_start: str, default_end: str) -> tuple:
+    """Resolve display start/end times, migrating legacy exam_time rows"""
+    start_time = exam.get("start_time", "")
+    end_time = exam.get("end_time", "")
+    if not start_time and exam.get("exam_time"):
+        start_time = exam["exam_time"]
+        duration = exam.get("duration", 0)
+        if duration:
+            end_time = _compute_end_time(start_time, duration) or end_time
+    return start_time or default_start, end_time or default_end
+
+
+# The create-exam form and the missing-id edit error render the same
+# context every time; build them once at import instead of per request
+_CREATE_EXAM_DEFAULT_CTX = {
+    "lecturer_id": "",
+    "exam_id": "",
+    "title": "",
+    "description": "",
+    "duration": "",
+    "exam_date": "",
+    "start_time": "",
+    "end_time": "",
+    "instructions": "",
+    "errors_html": "",
+    **_build_filter_context({}),
+}
+
+_EDIT_MISSING_ID_CTX = {
+    "errors_html": '<div class="alert alert-danger">Error: Exam ID is missing.</div>',
+    "filters_json": "{}",
+}
+
+_SUCCESS_SAVED_HTML = """
+        <div class="alert alert-success mb-3">
+            <strong>Success!</strong> Exam details and filters saved.
+        </div>
+        """
+
+
 def get_create_exam(lecturer_id: str = ""):
     html_str = render(
         "create_exam.html",
-        {
-            "lecturer_id": lecturer_id,
-            "exam_id": "",
-            "title": "",
-            "description": "",
-            "duration": "",
-            "exam_date": "",
-            "start_time": "",
-            "end_time": "",
-            "instructions": "",
-            "errors_html": "",
-            **_build_filter_context({}),
-        },
+        {**_CREATE_EXAM_DEFAULT_CTX, "lecturer_id": lecturer_id},
     )
     return html_str, 200
 
 
 def get_edit_exam(exam_id: str):
     if not exam_id:
-        html_str = render(
-            "exam_edit.html",
-            {
-                "errors_html": '<div class="alert alert-danger">Error: Exam ID is missing.</div>',
-                "filters_json": "{}",
-            },
-        )
+        html_str = render("exam_edit.html", dict(_EDIT_MISSING_ID_CTX))
         return html_str, 400
 
     exam = get_exam_by_id(exam_id)
@@ -126,13 +334,9 @@ def get_edit_exam(exam_id: str):
     # ✅ FIX: Get existing filters
     filters = get_exam_filters(exam_id)
 
-    print(f"🔍 DEBUG - Retrieved filters for {exam_id}: {filters}")  # Debug
-
     # Create clean JSON
     filters_json_str = json.dumps(filters)
 
-    from services.student_filter_service import get_available_filters
-
     available = get_available_filters()
 
     ctx = {
@@ -158,35 +362,20 @@ def get_edit_exam(exam_id: str):
 
 
 def post_edit_exam(body: str):
-    form = _parse_form(body)
+    form, errors = _parse_and_validate(body, include_times=True)
     exam_id = form.get("exam_id")
 
     if not exam_id:
-        ctx = dict(form)
+        ctx = form
         ctx["errors_html"] = (
             '<div class="alert alert-danger mb-3"><strong>Error:</strong> Exam ID is missing.</div>'
         )
         html_str = render("exam_edit.html", ctx)
         return html_str, 400
 
-    # 1. Validation
-    errors = validate_exam(
-        form["title"], form["description"], form["duration"], form["instructions"]
-    )
-    errors.extend(validate_exam_date(form["exam_date"]))
-    errors.extend(
-        validate_exam_times(form["start_time"], form["end_time"], form["duration"])
-    )
-
-    # 2. Handle errors
+    # Handle validation errors
     if errors:
-        error_items = "".join(f"<li>{html.escape(e)}</li>" for e in errors)
-        errors_html = f"""
-        <div class="alert alert-danger mb-3">
-            <strong>Please fix the following:</strong>
-            <ul class="mb-0">{error_items}</ul>
-        </div>
-        """
+        errors_html = _ERR_BANNER_SUBMIT_TPL.format(items=_error_items(errors))
 
         filters = {
             "years": form.get("filter_years", []),
@@ -194,13 +383,9 @@ def post_edit_exam(body: str):
             "semesters": form.get("filter_semesters", []),
         }
 
-        from services.student_filter_service import get_available_filters
-
         available = get_available_filters()
 
-        ctx = dict(form)
-        ctx["start_time"] = form["start_time"]
-        ctx["end_time"] = form["end_time"]
+        ctx = form
         ctx["errors_html"] = errors_html
         ctx["success_html"] = ""
         ctx["filters_json"] = json.dumps(filters)
@@ -229,27 +414,14 @@ def post_edit_exam(body: str):
             "semesters": form.get("filter_semesters", []),
         }
 
-        print(f"💾 DEBUG - Saving filters for {exam_id}: {filters}")  # Debug
-
         save_exam_filters(exam_id, filters)
-
-        # Verify save worked
-        saved_filters = get_exam_filters(exam_id)
-        print(f"✅ DEBUG - Verified saved filters: {saved_filters}")  # Debug
+        invalidate_question_cache(exam_id)
 
         # 4. Success
-        success_html = """
-        <div class="alert alert-success mb-3">
-            <strong>Success!</strong> Exam details and filters saved.
-        </div>
-        """
-
-        from services.student_filter_service import get_available_filters
-
         available = get_available_filters()
 
-        ctx = dict(form)
-        ctx["success_html"] = success_html
+        ctx = form
+        ctx["success_html"] = _SUCCESS_SAVED_HTML
         ctx["errors_html"] = ""
         ctx["filters_json"] = json.dumps(filters)
         ctx.update(_build_filter_context(filters, available.get("majors", [])))
@@ -260,7 +432,7 @@ def post_edit_exam(body: str):
     except ValueError as e:
         errors_html = f"""
         <div class="alert alert-danger mb-3">
-            <strong>Database Error:</strong> {html.escape(str(e))}
+            <strong>Database Error:</strong> {_esc(e)}
         </div>
         """
 
@@ -270,7 +442,7 @@ def post_edit_exam(body: str):
             "semesters": form.get("filter_semesters", []),
         }
 
-        ctx = dict(form)
+        ctx = form
         ctx["errors_html"] = errors_html
         ctx["filters_json"] = json.dumps(filters)
         html_str = render("exam_edit.html", ctx)
@@ -278,25 +450,11 @@ def post_edit_exam(body: str):
 
 
 def post_publish_exam(body: str):
-    form = _parse_form(body)
-
-    errors = validate_exam(
-        form["title"], form["description"], form["duration"], form["instructions"]
-    )
-    errors.extend(validate_exam_date(form["exam_date"]))
-
-    if not form["exam_id"]:
-        errors.append("Missing exam ID. Please save the exam again.")
+    form, errors = _parse_and_validate(body, require_id=True)
 
     if errors:
-        error_items = "".join(f"<li>{html.escape(e)}</li>" for e in errors)
-        errors_html = f"""
-        <div class="alert alert-danger mb-3">
-            <strong>Unable to publish exam:</strong>
-            <ul class="mb-0">{error_items}</ul>
-        </div>
-        """
-        ctx = dict(form)
+        errors_html = _ERR_BANNER_PUBLISH_TPL.format(items=_error_items(errors))
+        ctx = form
         ctx["errors_html"] = errors_html
         html_str = render("create_exam.html", ctx)
         return html_str, 400
@@ -305,17 +463,12 @@ def post_publish_exam(body: str):
     # Note: save_exam_draft here updates status if it was draft, or just content
     exam_id = save_exam_draft(
         exam_id=form["exam_id"],
-        title=form["title"],
-        description=form["description"],
-        duration=form["duration"],
-        instructions=form["instructions"],
-        exam_date=form["exam_date"],
-        start_time=form["start_time"],
-        end_time=form["end_time"],
+        **_draft_kwargs(form),
     )
 
     # Change status to published
     publish_exam(exam_id)
+    invalidate_question_cache(exam_id)
 
     # Get the saved filters for display
     filters = get_exam_filters(exam_id)
@@ -325,7 +478,7 @@ def post_publish_exam(body: str):
     exam = get_exam_by_id(exam_id)
     lecturer_id = exam.get("created_by", "") if exam else form.get("lecturer_id", "")
 
-    ctx = dict(form)
+    ctx = form
     ctx["exam_id"] = exam_id
     ctx["filter_summary"] = get_filter_summary(filters)
     ctx["lecturer_id"] = lecturer_id  # <--- Pass to template
@@ -334,22 +487,61 @@ def post_publish_exam(body: str):
     return html_str, 200
 
 
-def post_submit_exam(body: str):
+def _parse_and_validate(
+    body: str, require_id: bool = False, include_times: bool = False
+):
+    """
+    Parse a posted exam form and run the shared validators once.
+
+    Returns (form, errors). Both the submit and publish handlers funnel
+    through here, so a form whose digest already passed validation (a
+    publish re-posting the form submit just saved) skips both validators.
+    """
     form = _parse_form(body)
 
-    errors = validate_exam(
-        form["title"], form["description"], form["duration"], form["instructions"]
-    )
-    errors.extend(validate_exam_date(form["exam_date"]))
+    form_hash = _validation_hash(form)
+    if form_hash in _VALIDATED_FORM_HASHES:
+        # Same fields already validated when the draft was saved
+        errors = []
+    else:
+        errors = validate_exam(
+            form["title"], form["description"], form["duration"], form["instructions"]
+        )
+        errors.extend(validate_exam_date(form["exam_date"]))
+
+    if include_times:
+        # Times are outside the memoized digest, so always validate them
+        errors.extend(
+            validate_exam_times(form["start_time"], form["end_time"], form["duration"])
+        )
+
+    if require_id and not form["exam_id"]:
+        errors.append("Missing exam ID. Please save the exam again.")
+
+    if not errors:
+        _mark_form_validated(form_hash)
+
+    return form, errors
+
+
+def _draft_kwargs(form: dict) -> dict:
+    """Keyword arguments for save_exam_draft shared by submit and publish"""
+    return {
+        "title": form["title"],
+        "description": form["description"],
+        "duration": form["duration"],
+        "instructions": form["instructions"],
+        "exam_date": form["exam_date"],
+        "start_time": form["start_time"],
+        "end_time": form["end_time"],
+    }
+
+
+def post_submit_exam(body: str):
+    form, errors = _parse_and_validate(body)
 
     if errors:
-        error_items = "".join(f"<li>{html.escape(e)}</li>" for e in errors)
-        errors_html = f"""
-        <div class="alert alert-danger mb-3">
-            <strong>Please fix the following:</strong>
-            <ul class="mb-0">{error_items}</ul>
-        </div>
-        """
+        errors_html = _ERR_BANNER_SUBMIT_TPL.format(items=_error_items(errors))
 
         filters = {
             "years": form.get("filter_years", []),
@@ -357,11 +549,9 @@ def post_submit_exam(body: str):
             "semesters": form.get("filter_semesters", []),
         }
 
-        from services.student_filter_service import get_available_filters
-
         available = get_available_filters()
 
-        ctx = dict(form)
+        ctx = form
         ctx["errors_html"] = errors_html
         ctx.update(_build_filter_context(filters, available.get("majors", [])))
 
@@ -371,14 +561,8 @@ def post_submit_exam(body: str):
     # Valid: Save/update draft in DB
     exam_id = save_exam_draft(
         exam_id=form["exam_id"] or None,
-        title=form["title"],
-        description=form["description"],
-        duration=form["duration"],
-        instructions=form["instructions"],
-        exam_date=form["exam_date"],
-        start_time=form["start_time"],
-        end_time=form["end_time"],
         created_by=form.get("lecturer_id"),  # <--- THIS IS THE KEY FIX
+        **_draft_kwargs(form),
     )
 
     # Save filters
@@ -389,27 +573,16 @@ def post_submit_exam(body: str):
     }
 
     save_exam_filters(exam_id, filters)
+    invalidate_question_cache(exam_id)
 
-    has_mcq = has_mcq_for_exam(exam_id)
-    has_short = has_short_for_exam(exam_id)
+    has_mcq, has_short = _question_flags_cached(exam_id)
 
-    ctx = dict(form)
+    ctx = form
     ctx["exam_id"] = exam_id
     ctx["filter_summary"] = get_filter_summary(filters)
 
-    if has_mcq:
-        ctx["mcq_button_label"] = "View / Edit MCQ"
-        ctx["mcq_button_class"] = "btn btn-primary"
-    else:
-        ctx["mcq_button_label"] = "Build MCQ"
-        ctx["mcq_button_class"] = "btn btn-outline-primary"
-
-    if has_short:
-        ctx["short_button_label"] = "View / Edit Short Answers"
-        ctx["short_button_class"] = "btn btn-primary"
-    else:
-        ctx["short_button_label"] = "Build Short Answers"
-        ctx["short_button_class"] = "btn btn-outline-primary"
+    ctx["mcq_button_label"], ctx["mcq_button_class"] = _MCQ_BTN[has_mcq]
+    ctx["short_button_label"], ctx["short_button_class"] = _SHORT_BTN[has_short]
 
     html_str = render("exam_review.html", ctx)
     return html_str, 200
@@ -418,66 +591,100 @@ def post_submit_exam(body: str):
 # --- Additional handlers (keeping existing code) ---
 
 
-def get_exam_review(exam_id: str):
-    if not exam_id:
-        html_str = render(
-            "exam_review.html",
-            {
-                "exam_id": "",
-                "title": "",
-                "description": "",
-                "exam_date": "",
-                "start_time": "",
-                "end_time": "",
-                "instructions": "",
-                "mcq_button_label": "Build MCQ",
-                "mcq_button_class": "btn btn-outline-primary",
-                "short_button_label": "Build Short Answers",
-                "short_button_class": "btn btn-outline-primary",
-                "filter_summary": "All Students",
-            },
-        )
-        return html_str, 400
-
-    exam = get_exam_by_id(exam_id)
+# Default contexts for the review/published error branches. The missing-id
+# pages never vary, so they are rendered once at import and returned as
+# constant (html, status) tuples; the not-found branches only overlay the
+# exam id and title on the shared defaults.
+_REVIEW_DEFAULT_CTX = {
+    "exam_id": "",
+    "title": "",
+    "description": "",
+    "exam_date": "",
+    "start_time": "",
+    "end_time": "",
+    "instructions": "",
+    "mcq_button_label": "Build MCQ",
+    "mcq_button_class": "btn btn-outline-primary",
+    "short_button_label": "Build Short Answers",
+    "short_button_class": "btn btn-outline-primary",
+    "filter_summary": "All Students",
+}
+_PUBLISHED_DEFAULT_CTX = {
+    "exam_id": "",
+    "title": "",
+    "description": "",
+    "duration": "",
+    "exam_date": "",
+    "start_time": "",
+    "end_time": "",
+    "instructions": "",
+    "filter_summary": "All Students",
+}
+_REVIEW_400_PAGE = (render("exam_review.html", _REVIEW_DEFAULT_CTX), 400)
+_PUBLISHED_400_PAGE = (render("exam_published.html", _PUBLISHED_DEFAULT_CTX), 400)
+
+
+# Seeds the exam-list ETag so validators from a previous process run --
+# whose version counter also started at zero -- can never produce a
+# false 304 against this one
+_ETAG_NONCE = secrets.token_hex(4)
+
+
+def _exam_list_etag(search: str, sort: str, lecturer_id) -> str:
+    """Weak ETag for one exam-list view (per-process data version + scope)"""
+    scope = hashlib.blake2b(
+        "{}|{}|{}".format(search, sort, lecturer_id or "").encode(),
+        digest_size=8,
+    ).hexdigest()
+    return 'W/"exam-list-{}-{}-{}"'.format(_ETAG_NONCE, exam_data_version(), scope)
+
+
+def get_exam_list_conditional(
+    if_none_match=None,
+    success_message: str = "",
+    search: str = "",
+    sort: str = "date",
+    lecturer_id: str = None,
+):
+    """
+    Conditional wrapper around get_exam_list with ETag revalidation.
+
+    Returns (html_str, status, etag). A request whose If-None-Match still
+    names the current data version for this search/sort/lecturer scope
+    gets an empty 304 and skips the fetch and render entirely; all exam
+    writes go through this process and bump the version, so matches are
+    safe to short-circuit.
+    """
+    etag = _exam_list_etag(search, sort, lecturer_id)
+    if if_none_match and if_none_match == etag:
+        return "", 304, etag
+
+    html_str, status = get_exam_list(success_message, search, sort, lecturer_id)
+    # The fetch may have advanced the version; tag the response with the
+    # value matching what was just rendered
+    return html_str, status, _exam_list_etag(search, sort, lecturer_id)
+
+
+def _render_exam_page(
+    exam_id: str,
+    template: str,
+    default_ctx: dict,
+    not_found_title: str,
+    decorate_buttons: bool,
+):
+    """Shared fetch + legacy-time migration + context assembly for the
+    review and published pages, which differ only in template and the
+    MCQ/short button decoration."""
+    exam = _get_exam_cached(exam_id)
     if not exam:
         html_str = render(
-            "exam_review.html",
-            {
-                "exam_id": exam_id,
-                "title": "Exam not found",
-                "description": "",
-                "duration": "",
-                "exam_date": "",
-                "start_time": "",
-                "end_time": "",
-                "instructions": "",
-                "mcq_button_label": "Build MCQ",
-                "mcq_button_class": "btn btn-outline-primary",
-                "short_button_label": "Build Short Answers",
-                "short_button_class": "btn btn-outline-primary",
-                "filter_summary": "All Students",
-            },
+            template,
+            {**default_ctx, "exam_id": exam_id, "title": not_found_title},
         )
         return html_str, 404
 
-    start_time = exam.get("start_time", "")
-    end_time = exam.get("end_time", "")
     duration = exam.get("duration", 0)
-
-    if not start_time and exam.get("exam_time"):
-        start_time = exam.get("exam_time", "00:00")
-        if duration:
-            start_h, start_m = map(int, start_time.split(":"))
-            total_minutes = start_h * 60 + start_m + int(duration)
-            end_h = (total_minutes // 60) % 24
-            end_m = total_minutes % 60
-            end_time = f"{end_h:02d}:{end_m:02d}"
-
-    if not start_time:
-        start_time = "00:00"
-    if not end_time:
-        end_time = "01:00"
+    start_time, end_time = _exam_times(exam, "00:00", "01:00")
 
     filters = get_exam_filters(exam_id)
     filter_summary = get_filter_summary(filters)
@@ -496,100 +703,39 @@ def get_exam_review(exam_id: str):
         "lecturer_id": exam.get("created_by", ""),
     }
 
-    has_mcq = has_mcq_for_exam(ctx["exam_id"])
-    has_short = has_short_for_exam(ctx["exam_id"])
-
-    if has_mcq:
-        ctx["mcq_button_label"] = "View / Edit MCQ"
-        ctx["mcq_button_class"] = "btn btn-primary"
-    else:
-        ctx["mcq_button_label"] = "Build MCQ"
-        ctx["mcq_button_class"] = "btn btn-outline-primary"
+    if decorate_buttons:
+        has_mcq, has_short = _question_flags_cached(ctx["exam_id"])
+        ctx["mcq_button_label"], ctx["mcq_button_class"] = _MCQ_BTN[has_mcq]
+        ctx["short_button_label"], ctx["short_button_class"] = _SHORT_BTN[has_short]
 
-    if has_short:
-        ctx["short_button_label"] = "View / Edit Short Answers"
-        ctx["short_button_class"] = "btn btn-primary"
-    else:
-        ctx["short_button_label"] = "Build Short Answers"
-        ctx["short_button_class"] = "btn btn-outline-primary"
-
-    html_str = render("exam_review.html", ctx)
+    html_str = render(template, ctx)
     return html_str, 200
 
 
-def get_exam_published(exam_id: str):
+def get_exam_review(exam_id: str):
     if not exam_id:
-        html_str = render(
-            "exam_published.html",
-            {
-                "exam_id": "",
-                "title": "",
-                "description": "",
-                "duration": "",
-                "exam_date": "",
-                "start_time": "",
-                "end_time": "",
-                "instructions": "",
-                "filter_summary": "All Students",
-            },
-        )
-        return html_str, 400
-
-    exam = get_exam_by_id(exam_id)
-    if not exam:
-        html_str = render(
-            "exam_published.html",
-            {
-                "exam_id": exam_id,
-                "title": f"Exam {exam_id} not found",
-                "description": "",
-                "duration": "",
-                "exam_date": "",
-                "start_time": "",
-                "end_time": "",
-                "instructions": "",
-                "filter_summary": "All Students",
-            },
-        )
-        return html_str, 404
-
-    start_time = exam.get("start_time", "")
-    end_time = exam.get("end_time", "")
-    duration = exam.get("duration", 0)
-
-    if not start_time and exam.get("exam_time"):
-        start_time = exam.get("exam_time", "00:00")
-        if duration:
-            start_h, start_m = map(int, start_time.split(":"))
-            total_minutes = start_h * 60 + start_m + int(duration)
-            end_h = (total_minutes // 60) % 24
-            end_m = total_minutes % 60
-            end_time = f"{end_h:02d}:{end_m:02d}"
-
-    if not start_time:
-        start_time = "00:00"
-    if not end_time:
-        end_time = "01:00"
-
-    filters = get_exam_filters(exam_id)
-    filter_summary = get_filter_summary(filters)
+        return _REVIEW_400_PAGE
+
+    return _render_exam_page(
+        exam_id,
+        "exam_review.html",
+        {**_REVIEW_DEFAULT_CTX, "duration": ""},
+        "Exam not found",
+        decorate_buttons=True,
+    )
 
-    ctx = {
-        "exam_id": exam.get("exam_id", exam_id),
-        "title": exam.get("title", ""),
-        "description": exam.get("description", ""),
-        "duration": str(duration),
-        "exam_date": exam.get("exam_date", ""),
-        "start_time": start_time,
-        "end_time": end_time,
-        "instructions": exam.get("instructions", ""),
-        "filter_summary": filter_summary,
-        # FIX: Ensure we recover the lecturer ID from the database
-        "lecturer_id": exam.get("created_by", ""),
-    }
 
-    html_str = render("exam_published.html", ctx)
-    return html_str, 200
+def get_exam_published(exam_id: str):
+    if not exam_id:
+        return _PUBLISHED_400_PAGE
+
+    return _render_exam_page(
+        exam_id,
+        "exam_published.html",
+        _PUBLISHED_DEFAULT_CTX,
+        f"Exam {exam_id} not found",
+        decorate_buttons=False,
+    )
 
 
 def get_exam_delete(exam_id: str, method: str = "hard"):
@@ -613,7 +759,7 @@ def get_exam_delete(exam_id: str, method: str = "hard"):
     except ValueError as e:
         html_str = f"""
         <div class="alert alert-danger mt-3">
-            <strong>Could not delete exam:</strong> {html.escape(str(e))}
+            <strong>Could not delete exam:</strong> {_esc(e)}
         </div>
         <a href="/exam-list" class="btn btn-primary mt-2">Back to exams</a>
         """
@@ -622,6 +768,87 @@ def get_exam_delete(exam_id: str, method: str = "hard"):
     return get_exam_list(success_message=msg)
 
 
+# Hoisted once per process: the exam-list card markup and its action
+# button variants only vary by a handful of fields, so each card render
+# is a format_map call instead of re-building the f-string chrome
+_EXAM_LIST_EMPTY_HTML = """
+        <div class="alert alert-info">
+            <h5>No exams found</h5>
+            <p class="mb-0">Click "Create New Exam" to get started.</p>
+        </div>
+        """
+
+_STATUS_BADGES = {
+    "published": '<span class="exam-status status-published">Published</span>',
+    "draft": '<span class="exam-status status-draft">Draft</span>',
+}
+
+_GRADE_BTN_LOCKED_TPL = """
+                    <button class="btn btn-sm btn-secondary" disabled title="{lock_msg}">
+                        🔒 Grading Closed
+                    </button>
+                    """
+_GRADE_BTN_TPL = '<a href="/grade-submissions?exam_id={e_id}" class="btn btn-sm btn-success">Grade</a>'
+
+_ACTIONS_PUBLISHED_TPL = """
+                    <a href="/exam-edit?exam_id={e_id}" class="btn btn-sm btn-outline-primary">Edit Details</a>
+                    <a href="/exam-review?exam_id={e_id}" class="btn btn-sm btn-info">View</a>
+                    {grade_btn}
+                    <button type="button"
+                        class="btn btn-sm btn-danger"
+                        data-bs-toggle="modal"
+                        data-bs-target="#deleteExamModal"
+                        data-exam-id="{e_id}"
+                        data-exam-title="{title}">
+                        Delete
+                    </button>
+                """
+
+_ACTIONS_DRAFT_TPL = """
+                    <a href="/exam-edit?exam_id={e_id}" class="btn btn-sm btn-outline-primary">Edit Details</a>
+                    <a href="/exam-review?exam_id={e_id}" class="btn btn-sm btn-primary">Add Questions / Review</a>
+                    <button type="button"
+                        class="btn btn-sm btn-danger"
+                        data-bs-toggle="modal"
+                        data-bs-target="#deleteExamModal"
+                        data-exam-id="{e_id}"
+                        data-exam-title="{title}">
+                        Delete
+                    </button>
+                """
+
+_EXAM_CARD_TPL = """
+                <div class="exam-card" data-title="{title_key}" data-date="{date}">
+                    <div class="exam-info">
+                        <h5 class="exam-title">
+                            {title_display} {status_badge} {filter_badge}
+                        </h5>
+                        <p class="exam-desc">{description}</p>
+                        <div class="exam-meta">
+                            <span>📅 {date}</span>
+                            <span>🕐 {start_time} - {end_time}</span>
+                            <span>⏱️ {duration} mins</span>
+                            <span class="exam-id">ID: {e_id}</span>
+                        </div>
+                    </div>
+                    <div class="exam-actions">
+                        {actions}
+                    </div>
+                </div>
+            """
+
+
+# Sort keys hoisted out of get_exam_list so each request reuses the same
+# function objects. operator.itemgetter would be faster still, but legacy
+# exam docs can miss these fields entirely, so .get with a default stays.
+def _title_sort_key(exam: dict) -> str:
+    return str(exam.get("title", "")).lower()
+
+
+def _date_sort_key(exam: dict) -> str:
+    return str(exam.get("exam_date", ""))
+
+
 def get_exam_list(
     success_message: str = "",
     search: str = "",
@@ -644,51 +871,23 @@ def get_exam_list(
         ]
 
     if sort == "title":
-        all_exams.sort(key=lambda e: str(e.get("title", "")).lower())
+        all_exams.sort(key=_title_sort_key)
     else:
-        all_exams.sort(
-            key=lambda e: str(e.get("exam_date", "")),
-            reverse=True,
-        )
+        all_exams.sort(key=_date_sort_key, reverse=True)
 
-    exam_list_html = ""
+    card_parts = []
 
     if not all_exams:
-        exam_list_html = """
-        <div class="alert alert-info">
-            <h5>No exams found</h5>
-            <p class="mb-0">Click "Create New Exam" to get started.</p>
-        </div>
-        """
+        exam_list_html = _EXAM_LIST_EMPTY_HTML
     else:
         for exam in all_exams:
-            if exam.get("is_deleted"):
-                continue
             e_id = exam.get("exam_id", "")
-            title = html.escape(exam.get("title", "Untitled"))
-            description = html.escape(exam.get("description", "No description"))
+            title = _esc(exam.get("title", "Untitled"))
+            description = _esc(exam.get("description", "No description"))
             duration = exam.get("duration", 0)
             date = exam.get("exam_date", "N/A")
 
-            start_time = exam.get("start_time", "")
-            end_time = exam.get("end_time", "")
-
-            if not start_time and exam.get("exam_time"):
-                start_time = exam.get("exam_time", "N/A")
-                if duration and start_time != "N/A":
-                    try:
-                        start_h, start_m = map(int, start_time.split(":"))
-                        total_minutes = start_h * 60 + start_m + int(duration)
-                        end_h = (total_minutes // 60) % 24
-                        end_m = total_minutes % 60
-                        end_time = f"{end_h:02d}:{end_m:02d}"
-                    except Exception:
-                        end_time = "N/A"
-
-            if not start_time:
-                start_time = "N/A"
-            if not end_time:
-                end_time = "N/A"
+            start_time, end_time = _exam_times(exam, "N/A", "N/A")
 
             status = exam.get("status", "draft")
 
@@ -704,78 +903,48 @@ def get_exam_list(
                 filter_summary = get_filter_summary(filters)
                 if len(filter_summary) > 50:
                     filter_summary = filter_summary[:47] + "..."
-                filter_badge = f'<span class="badge bg-info text-dark ms-2" title="{html.escape(get_filter_summary(filters))}">👥 {html.escape(filter_summary)}</span>'
+                filter_badge = f'<span class="badge bg-info text-dark ms-2" title="{_esc(get_filter_summary(filters))}">👥 {_esc(filter_summary)}</span>'
             else:
                 filter_badge = ""
 
-            if status == "published":
-                status_badge = (
-                    '<span class="exam-status status-published">Published</span>'
-                )
+            status_badge = _STATUS_BADGES.get(status, _STATUS_BADGES["draft"])
 
-                is_locked, lock_msg, _ = check_grading_locked(e_id)
+            if status == "published":
+                is_locked, lock_msg, _ = evaluate_grading_lock(exam)
 
                 if is_locked:
-                    grade_btn = f"""
-                    <button class="btn btn-sm btn-secondary" disabled title="{html.escape(lock_msg)}">
-                        🔒 Grading Closed
-                    </button>
-                    """
+                    grade_btn = _GRADE_BTN_LOCKED_TPL.format(lock_msg=_esc(lock_msg))
                 else:
-                    grade_btn = f'<a href="/grade-submissions?exam_id={e_id}" class="btn btn-sm btn-success">Grade</a>'
+                    grade_btn = _GRADE_BTN_TPL.format(e_id=e_id)
 
-                actions = f"""
-                    <a href="/exam-edit?exam_id={e_id}" class="btn btn-sm btn-outline-primary">Edit Details</a>
-                    <a href="/exam-review?exam_id={e_id}" class="btn btn-sm btn-info">View</a>
-                    {grade_btn}
-                    <button type="button"
-                        class="btn btn-sm btn-danger"
-                        data-bs-toggle="modal"
-                        data-bs-target="#deleteExamModal"
-                        data-exam-id="{e_id}"
-                        data-exam-title="{title}">
-                        Delete
-                    </button>
-                """
+                actions = _ACTIONS_PUBLISHED_TPL.format(
+                    e_id=e_id, title=title, grade_btn=grade_btn
+                )
             else:
-                status_badge = '<span class="exam-status status-draft">Draft</span>'
-                actions = f"""
-                    <a href="/exam-edit?exam_id={e_id}" class="btn btn-sm btn-outline-primary">Edit Details</a>
-                    <a href="/exam-review?exam_id={e_id}" class="btn btn-sm btn-primary">Add Questions / Review</a>
-                    <button type="button"
-                        class="btn btn-sm btn-danger"
-                        data-bs-toggle="modal"
-                        data-bs-target="#deleteExamModal"
-                        data-exam-id="{e_id}"
-                        data-exam-title="{title}">
-                        Delete
-                    </button>
-                """
+                actions = _ACTIONS_DRAFT_TPL.format(e_id=e_id, title=title)
 
-            title_raw = exam.get("title", "Untitled")
-            title_display = html.escape(title_raw)
-            title_key = html.escape(title_raw.lower())
+            title_key = exam.get("title", "Untitled").translate(_LOWER_ESC_TABLE)
             date = exam.get("exam_date", "N/A")
 
-            exam_list_html += f"""
-                <div class="exam-card" data-title="{title_key}" data-date="{date}">
-                    <div class="exam-info">
-                        <h5 class="exam-title">
-                            {title_display} {status_badge} {filter_badge}
-                        </h5>
-                        <p class="exam-desc">{description}</p>
-                        <div class="exam-meta">
-                            <span>📅 {date}</span>
-                            <span>🕐 {start_time} - {end_time}</span>
-                            <span>⏱️ {duration} mins</span>
-                            <span class="exam-id">ID: {e_id}</span>
-                        </div>
-                    </div>
-                    <div class="exam-actions">
-                        {actions}
-                    </div>
-                </div>
-            """
+            card_parts.append(
+                _EXAM_CARD_TPL.format_map(
+                    {
+                        "title_key": title_key,
+                        "date": date,
+                        "title_display": title,
+                        "status_badge": status_badge,
+                        "filter_badge": filter_badge,
+                        "description": description,
+                        "start_time": start_time,
+                        "end_time": end_time,
+                        "duration": duration,
+                        "e_id": e_id,
+                        "actions": actions,
+                    }
+                )
+            )
+
+        exam_list_html = "".join(card_parts)
 
     html_str = render(
         "exam_list.html",
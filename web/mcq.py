@@ -1,7 +1,8 @@
-from urllib.parse import parse_qs
+from urllib.parse import parse_qsl
 import html
 
 from web.template_engine import render
+from web.exams import invalidate_question_cache
 from services.exam_service import get_exam_by_id
 from services.question_service import (
     create_mcq_question,
@@ -12,21 +13,22 @@ from services.question_service import (
 
 
 def _parse_form(body: str) -> dict:
-    data = parse_qs(body)
-
-    def get_field(key: str) -> str:
-        return data.get(key, [""])[0]
-
-    return {
-        "exam_id": get_field("exam_id"),
-        "question_text": get_field("question_text"),
-        "option_a": get_field("option_a"),
-        "option_b": get_field("option_b"),
-        "option_c": get_field("option_c"),
-        "option_d": get_field("option_d"),
-        "correct_option": get_field("correct_option"),
-        "marks": get_field("marks"),
+    # One pass over decoded pairs into a fixed-key dict; the MCQ form only
+    # carries single-valued fields
+    form = {
+        "exam_id": "",
+        "question_text": "",
+        "option_a": "",
+        "option_b": "",
+        "option_c": "",
+        "option_d": "",
+        "correct_option": "",
+        "marks": "",
     }
+    for key, value in parse_qsl(body, max_num_fields=32):
+        if key in form:
+            form[key] = value
+    return form
 
 
 def _build_questions_preview_html(exam_id: str) -> str:
@@ -230,6 +232,7 @@ def post_mcq_builder(exam_id: str, body: str):
             correct_option=form["correct_option"],
             marks=int(form["marks"]),
         )
+        invalidate_question_cache(form["exam_id"])
     except ValueError as exc:
         errors_html = f"""
         <div class="alert alert-danger mb-3">
@@ -279,8 +282,8 @@ def post_mcq_builder(exam_id: str, body: str):
 
 
 def post_delete_mcq(exam_id: str, body: str):
-    data = parse_qs(body)
-    question_id = data.get("question_id", [""])[0]
+    data = dict(parse_qsl(body, max_num_fields=32))
+    question_id = data.get("question_id", "")
 
     errors_html = ""
     success_html = ""
@@ -299,6 +302,7 @@ def post_delete_mcq(exam_id: str, body: str):
         """
     else:
         delete_mcq_question(question_id)
+        invalidate_question_cache(exam_id)
         success_html = """
         <div class="alert alert-success mb-3">
             🗑️ MCQ question deleted successfully.
@@ -1,7 +1,8 @@
-from urllib.parse import parse_qs
+from urllib.parse import parse_qsl
 import html
 
 from web.template_engine import render
+from web.exams import invalidate_question_cache
 from services.question_service import (
     exam_exists,
     create_short_answer_question,
@@ -12,17 +13,17 @@ from services.exam_service import get_exam_by_id
 
 
 def _parse_form(body: str) -> dict:
-    data = parse_qs(body)
-
-    def get_field(key: str) -> str:
-        return data.get(key, [""])[0]
-
-    return {
-        "exam_id": get_field("exam_id"),
-        "question_text": get_field("question_text"),
-        "sample_answer": get_field("sample_answer"),
-        "marks": get_field("marks"),
+    # Same fixed-key single pass as the MCQ builder form parser
+    form = {
+        "exam_id": "",
+        "question_text": "",
+        "sample_answer": "",
+        "marks": "",
     }
+    for key, value in parse_qsl(body, max_num_fields=32):
+        if key in form:
+            form[key] = value
+    return form
 
 
 def _build_questions_preview_html(exam_id: str) -> str:
@@ -196,6 +197,7 @@ def post_short_builder(exam_id: str, body: str):
             sample_answer=form["sample_answer"],
             marks=int(form["marks"]),
         )
+        invalidate_question_cache(form["exam_id"])
     except ValueError as exc:
         errors_html = f"""
         <div class="alert alert-danger mb-3">
@@ -237,8 +239,8 @@ def post_short_builder(exam_id: str, body: str):
 
 
 def post_short_delete(exam_id: str, body: str):
-    data = parse_qs(body)
-    question_id = data.get("question_id", [""])[0]
+    data = dict(parse_qsl(body, max_num_fields=32))
+    question_id = data.get("question_id", "")
 
     errors_html = ""
     success_html = ""
@@ -257,6 +259,7 @@ def post_short_delete(exam_id: str, body: str):
         """
     else:
         delete_short_answer_question(question_id)
+        invalidate_question_cache(exam_id)
         success_html = """
         <div class="alert alert-success mb-3">
             🗑️ Short-answer question deleted successfully.
@@ -26,6 +26,7 @@ from services.student_submission_service import (
     get_student_performance_stats,
 )
 from core.firebase_db import db
+from firebase_admin import firestore
 
 
 def _build_questions_html(exam_id: str) -> str:
@@ -458,12 +459,25 @@ def post_submit_student_exam(body: str):
         "submitted_at": get_server_time(),
         "auto_submitted": False,
         "status": "completed",
+        # Grading flags are denormalized so admin queries can filter
+        # server-side; grading services flip them as work completes
+        "mcq_graded": False,
+        "sa_graded": False,
+        "fully_graded": False,
     }
 
+    exam_ref = db.collection("exams").document(exam_id)
     doc_ref = db.collection("submissions").document()
     doc_ref.set(submission_data)
     submission_id = doc_ref.id
 
+    # Keep the denormalized counter on the exam doc current so count
+    # displays can read it without scanning the submissions collection
+    try:
+        exam_ref.update({"total_submissions": firestore.Increment(1)})
+    except Exception as e:
+        print(f"Failed to bump total_submissions for {exam_id}: {e}")
+
     grading_result = grade_mcq_submission(exam_id, student_id, answers)
     save_grading_result(submission_id, grading_result)
 
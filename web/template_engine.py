@@ -1,5 +1,4 @@
 import os
-import html as _html
 import re
 
 _CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -8,89 +7,221 @@ TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
 STATIC_DIR = os.path.join(BASE_DIR, "static")
 
 
+# Same entities html.escape produces, but applied as one str.translate pass
+# instead of up to five chained .replace scans per context value
+_ESC_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+    }
+)
+
+
+def _escape(s: str) -> str:
+    return s.translate(_ESC_TABLE)
+
+
+# Precompiled once at import so render() doesn't pay regex compilation
+# (or recompilation-cache lookups) for every conditional block it processes.
+# Pattern: {% if variable %} content1 {% else %} content2 {% endif %}
+_IF_ELSE_RE = re.compile(
+    r"\{%\s*if\s+(\w+)\s*%\}(.*?)\{%\s*else\s*%\}(.*?)\{%\s*endif\s*%\}",
+    re.DOTALL,
+)
+# Pattern: {% if variable %} content {% endif %} (no else)
+_IF_RE = re.compile(r"\{%\s*if\s+(\w+)\s*%\}(.*?)\{%\s*endif\s*%\}", re.DOTALL)
+
+
+# Pattern: {{variable}} / {{variable|safe}}
+_VAR_RE = re.compile(r"\{\{(\w+)(\|safe)?\}\}")
+
+# Placeholders silently dropped (not echoed back) when absent from the
+# context, matching the old leftover-cleanup behaviour
+_OPTIONAL_KEYS = frozenset(("errors_html", "success_html"))
+
+
+def _compile_vars(text: str) -> list:
+    """Tokenize literal text into ("lit", s) and ("var", key, safe, raw)"""
+    tokens = []
+    pos = 0
+    for match in _VAR_RE.finditer(text):
+        if match.start() > pos:
+            tokens.append(("lit", text[pos : match.start()]))
+        key = match.group(1)
+        safe = bool(match.group(2)) or key.endswith("_html") or key.endswith("_json")
+        tokens.append(("var", key, safe, match.group(0)))
+        pos = match.end()
+    if pos < len(text):
+        tokens.append(("lit", text[pos:]))
+    return tokens
+
+
+def _compile_conditionals(text: str, pattern, inner) -> list:
+    """Tokenize {% if %} blocks into ("cond", var, true_toks, false_toks)"""
+    tokens = []
+    pos = 0
+    for match in pattern.finditer(text):
+        if match.start() > pos:
+            tokens.extend(inner(text[pos : match.start()]))
+        false_part = match.group(3) if match.lastindex >= 3 else ""
+        tokens.append(
+            ("cond", match.group(1), inner(match.group(2)), inner(false_part))
+        )
+        pos = match.end()
+    if pos < len(text):
+        tokens.extend(inner(text[pos:]))
+    return tokens
+
+
+def _compile_template(text: str) -> list:
+    """
+    Compile template text into a flat token list once, so each render is
+    a single walk over the tokens instead of re-scanning the whole string
+    for every conditional block and context key.
+
+    Mirrors the old processing order: if/else blocks first, then if-only
+    blocks, then variable substitution inside whatever text survives.
+    """
+
+    def if_only(segment: str) -> list:
+        return _compile_conditionals(segment, _IF_RE, _compile_vars)
+
+    return _compile_conditionals(text, _IF_ELSE_RE, if_only)
+
+
+def _emit(tokens: list, ctx: dict, out: list) -> None:
+    for token in tokens:
+        kind = token[0]
+        if kind == "lit":
+            out.append(token[1])
+        elif kind == "var":
+            key = token[1]
+            if key in ctx:
+                value = str(ctx[key])
+                out.append(value if token[2] else _escape(value))
+            elif key not in _OPTIONAL_KEYS:
+                # Unknown placeholders pass through verbatim, as before
+                out.append(token[3])
+        else:  # cond
+            var_value = ctx.get(token[1], "")
+            branch = token[2] if (var_value and var_value != "") else token[3]
+            _emit(branch, ctx, out)
+
+
+# Module-level template cache so each template file is read and kept in
+# memory once per process instead of being re-read on every render() call.
+_TEMPLATE_CACHE: dict = {}
+
+
 def load_template(name: str) -> str:
+    cached = _TEMPLATE_CACHE.get(name)
+    if cached is not None:
+        return cached
+
     path = os.path.join(TEMPLATE_DIR, name)
     with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+        content = f.read()
+
+    _TEMPLATE_CACHE[name] = content
+    return content
+
+
+# Compiled token lists per template, built on first render of each file
+_COMPILED_CACHE: dict = {}
+
+
+def _compiled_template(name: str) -> list:
+    compiled = _COMPILED_CACHE.get(name)
+    if compiled is None:
+        compiled = _compile_template(load_template(name))
+        _COMPILED_CACHE[name] = compiled
+    return compiled
+
+
+# Warm both caches for the pages that get re-rendered on every request or
+# POST branch, so even the first request after process start skips disk
+# I/O and token compilation. Missing files are ignored; load_template and
+# _compiled_template still lazy-load on demand.
+for _name in (
+    "base.html",
+    "admin_grading_setting.html",
+    "set_result_release.html",
+    "create_exam.html",
+    "exam_edit.html",
+    "exam_review.html",
+    "exam_published.html",
+    "exam_list.html",
+):
+    try:
+        _compiled_template(_name)
+    except OSError:
+        pass
+del _name
+
+
+def _render_content(template_name: str, context: dict) -> str:
+    """Render just the inner content of a template (no base page shell)"""
+    out: list = []
+    _emit(_compiled_template(template_name), context, out)
+    return "".join(out)
+
+
+def _base_parts() -> tuple:
+    """Split base.html around {{content}} once and cache the two halves"""
+    parts = _TEMPLATE_CACHE.get("__base_parts__")
+    if parts is None:
+        prefix, suffix = load_template("base.html").split("{{content}}", 1)
+        parts = (prefix, suffix)
+        _TEMPLATE_CACHE["__base_parts__"] = parts
+    return parts
 
 
 def render(template_name: str, context=None) -> str:
     if context is None:
         context = {}
 
-    base_html = load_template("base.html")
-    content_html = load_template(template_name)
-
-    # DEBUG
-    if "start_time" in context:
-        print(f"DEBUG template_engine: Rendering {template_name}")
-        print(f"  Context has start_time: '{context.get('start_time')}'")
-        print(f"  Context has end_time: '{context.get('end_time')}'")
-
-    # ==========================================
-    # NEW: Handle {% if variable %} ... {% else %} ... {% endif %} blocks
-    # ==========================================
-    def process_conditionals(html: str, ctx: dict) -> str:
-        # Pattern: {% if variable %} content1 {% else %} content2 {% endif %}
-        pattern = r"\{%\s*if\s+(\w+)\s*%\}(.*?)\{%\s*else\s*%\}(.*?)\{%\s*endif\s*%\}"
-
-        def replacer(match):
-            var_name = match.group(1)
-            true_content = match.group(2)
-            false_content = match.group(3)
-
-            # Check if variable exists and is truthy
-            var_value = ctx.get(var_name, "")
-            if var_value and var_value != "":
-                return true_content
-            else:
-                return false_content
-
-        html = re.sub(pattern, replacer, html, flags=re.DOTALL)
-
-        # Pattern: {% if variable %} content {% endif %} (no else)
-        pattern_no_else = r"\{%\s*if\s+(\w+)\s*%\}(.*?)\{%\s*endif\s*%\}"
-
-        def replacer_no_else(match):
-            var_name = match.group(1)
-            content = match.group(2)
-
-            var_value = ctx.get(var_name, "")
-            if var_value and var_value != "":
-                return content
-            else:
-                return ""
-
-        html = re.sub(pattern_no_else, replacer_no_else, html, flags=re.DOTALL)
-
-        return html
-
-    # Process conditionals FIRST
-    content_html = process_conditionals(content_html, context)
-
-    # ==========================================
-    # Replace {{variable}} and {{variable|safe}}
-    # ==========================================
-    for key, value in context.items():
-        # Handle {{variable|safe}} - no escaping
-        placeholder_safe = "{{" + key + "|safe}}"
-        content_html = content_html.replace(placeholder_safe, str(value))
-
-        # Handle {{variable}} - with escaping
-        placeholder = "{{" + key + "}}"
-        if key.endswith("_html") or key.endswith("_json"):
-            # Don't escape HTML or JSON content
-            replacement = str(value)
-        else:
-            replacement = _html.escape(str(value))
-        content_html = content_html.replace(placeholder, replacement)
-
-        # DEBUG for time fields
-        if key in ["start_time", "end_time"]:
-            print(f"  Replaced {placeholder} with '{replacement}'")
-
-    # Clean up any leftover placeholders
-    for leftover in ["{{errors_html}}", "{{success_html}}"]:
-        content_html = content_html.replace(leftover, "")
-
-    return base_html.replace("{{content}}", content_html)
+    prefix, suffix = _base_parts()
+    return prefix + _render_content(template_name, context) + suffix
+
+
+def render_parts(template_name: str, context=None):
+    """
+    Render a template as a list of page fragments.
+
+    Same output as render() but without the final full-page concatenation;
+    the server can encode and write the fragments one at a time, so the
+    first bytes go out before the whole page exists as one string.
+    """
+    if context is None:
+        context = {}
+
+    prefix, suffix = _base_parts()
+    return [prefix, _render_content(template_name, context), suffix]
+
+
+# Placeholder value that can't appear in template or context text; used to
+# find where streamed fragments should be spliced into rendered content
+_STREAM_SENTINEL = "\x00"
+
+
+def render_stream(template_name: str, context, stream_key: str, fragments):
+    """
+    Render a template as fragments, splicing a fragment list in place of
+    one placeholder instead of joining it into the context first.
+
+    Where render() would need fragments pre-joined into a single context
+    value (one large string copied again into the page), this keeps each
+    fragment as its own chunk so the server can write them out one at a
+    time without ever building the full page in memory.
+    """
+    if context is None:
+        context = {}
+
+    content = _render_content(template_name, {**context, stream_key: _STREAM_SENTINEL})
+    before, after = content.split(_STREAM_SENTINEL, 1)
+
+    prefix, suffix = _base_parts()
+    return [prefix, before, *fragments, after, suffix]